@@ -1,19 +1,37 @@
 # SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
 """The Heatmiser Neo integration."""
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import timedelta
 import logging
+from typing import Any
 
-from neohubapi.neohub import NeoHub
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_TOKEN, CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
-
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    CONF_DEFAULTS,
+    CONF_HVAC_MODES,
+    CONF_THERMOSTAT_OPTIONS,
+    CONF_TIMER_OPTIONS,
+    SIGNAL_OPTIONS_UPDATED,
+)
 from .coordinator import HeatmiserNeoCoordinator
+from .hub import (
+    HeatmiserNeoHub,
+    async_disconnect_unused_hub,
+    async_get_hub,
+    async_release_hub,
+)
+from .models import Capability, NeoDevice
+from .runtime import RuntimeCounters
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +46,20 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
+# Platforms that only have device entities, with the capabilities a device
+# needs to get one. They are forwarded once a device on the hub needs them;
+# the other platforms also have hub entities and are always forwarded.
+DEVICE_PLATFORMS = {
+    Platform.CLIMATE: Capability.CLIMATE,
+    Platform.LOCK: Capability.LOCK,
+    Platform.NUMBER: Capability.CLIMATE,
+}
+
+# Options that are applied without reloading the entry: entities read them
+# when used or when SIGNAL_OPTIONS_UPDATED is sent.
+LIVE_OPTIONS = {CONF_DEFAULTS, CONF_HVAC_MODES}
+LIVE_DEFAULTS = {CONF_THERMOSTAT_OPTIONS, CONF_TIMER_OPTIONS}
+
 type HeatmiserNeoConfigEntry = ConfigEntry[HeatmiserNeoData]
 
 
@@ -35,8 +67,12 @@ type HeatmiserNeoConfigEntry = ConfigEntry[HeatmiserNeoData]
 class HeatmiserNeoData:
     """Class to store Heatmiser Neo runtime data."""
 
-    hub: NeoHub
+    hub: HeatmiserNeoHub
     coordinator: HeatmiserNeoCoordinator
+    # Options the entities were last set up or updated with.
+    options: dict[str, Any] = field(default_factory=dict)
+    # Platforms forwarded to so far.
+    platforms: set[Platform] = field(default_factory=set)
 
 
 async def async_setup_entry(
@@ -52,20 +88,45 @@ async def async_setup_entry(
 
     # Make this configurable or retrieve from an API later.
     hub_serial_number = f"NEOHUB-SN:000000-{host}"
-    if token:
-        hub = NeoHub(host, port, token=token)
-    else:
-        hub = NeoHub(host, port)
-
-    coordinator = HeatmiserNeoCoordinator(hass, hub)
-
-    coordinator.serial_number = hub_serial_number
-
-    entry.runtime_data = HeatmiserNeoData(hub, coordinator)
-
-    await coordinator.async_config_entry_first_refresh()
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    hub = async_get_hub(hass, host, port, token)
 
+    # Everything after taking the shared client releases it if it fails.
+    try:
+        coordinator = HeatmiserNeoCoordinator(hass, hub)
+
+        coordinator.serial_number = hub_serial_number
+
+        entry.runtime_data = HeatmiserNeoData(
+            hub, coordinator, deepcopy(dict(entry.options))
+        )
+
+        await coordinator.runtime.async_load()
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        async_release_hub(hass, hub)
+        raise
+    platforms = _needed_platforms(coordinator.capabilities.values())
+    entry.runtime_data.platforms.update(platforms)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    @callback
+    def _async_devices_added(devices: Iterable[NeoDevice]) -> None:
+        """Forward to the platforms that new types of devices need."""
+        data = entry.runtime_data
+        new = _needed_platforms(
+            coordinator.capabilities[device.name] for device in devices
+        )
+        new = [platform for platform in new if platform not in data.platforms]
+        if not new:
+            return
+        # The platforms set up entities for every device already on the hub,
+        # including the new ones.
+        data.platforms.update(new)
+        entry.async_create_task(
+            hass, hass.config_entries.async_forward_entry_setups(entry, new)
+        )
+
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_devices_added))
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
@@ -74,8 +135,43 @@ async def async_setup_entry(
 async def async_update_options(
     hass: HomeAssistant, entry: HeatmiserNeoConfigEntry
 ) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Update options, reloading the entry only if they can't be applied live."""
+    data = entry.runtime_data
+    if _requires_reload(data.options, entry.options):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    data.options = deepcopy(dict(entry.options))
+    async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
+
+
+def _needed_platforms(capabilities: Iterable[Capability]) -> list[Platform]:
+    """Return the platforms needed by devices with the given capabilities."""
+    capabilities = list(capabilities)
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform not in DEVICE_PLATFORMS
+        or any(
+            caps & DEVICE_PLATFORMS[platform] == DEVICE_PLATFORMS[platform]
+            for caps in capabilities
+        )
+    ]
+
+
+def _requires_reload(old: Mapping[str, Any], new: Mapping[str, Any]) -> bool:
+    """Return whether options changed that only take effect on setup."""
+
+    def _fixed(options: Mapping[str, Any]) -> tuple[dict, dict]:
+        return (
+            {k: v for k, v in options.items() if k not in LIVE_OPTIONS},
+            {
+                k: v
+                for k, v in options.get(CONF_DEFAULTS, {}).items()
+                if k not in LIVE_DEFAULTS
+            },
+        )
+
+    return _fixed(old) != _fixed(new)
 
 
 async def async_unload_entry(
@@ -83,13 +179,31 @@ async def async_unload_entry(
 ) -> bool:
     """Unload a config entry."""
     hub = entry.runtime_data.hub
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
 
-    await hub.disconnect()
+    # The client is kept connected for a while, so that a reload reuses it,
+    # unless Home Assistant is stopping. Removing the entry disconnects it.
+    async_release_hub(hass, hub)
+    await entry.runtime_data.coordinator.runtime.async_save()
 
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: HeatmiserNeoConfigEntry
+) -> None:
+    """Disconnect from the hub and remove the runtime counters of a deleted entry."""
+    await async_disconnect_unused_hub(
+        hass,
+        entry.data[CONF_HOST],
+        entry.data[CONF_PORT],
+        entry.data.get(CONF_API_TOKEN),
+    )
+    await RuntimeCounters(hass, entry.entry_id).async_remove()
+
+
 async def options_update_listener(
     hass: HomeAssistant, config_entry: HeatmiserNeoConfigEntry
 ):
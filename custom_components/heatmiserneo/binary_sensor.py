@@ -2,14 +2,14 @@
 
 """Heatmiser Neo Binary Sensors via Heatmiser Neo-hub."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 import datetime
 from functools import partial
 import logging
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub, NeoHubConnectionError
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -18,7 +18,8 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -27,13 +28,10 @@ from . import HeatmiserNeoConfigEntry
 from .const import (
     ATTR_AWAY_END,
     ATTR_AWAY_STATE,
-    HEATMISER_TYPE_IDS_AWAY,
-    HEATMISER_TYPE_IDS_HOLD,
-    HEATMISER_TYPE_IDS_STANDBY,
-    HEATMISER_TYPE_IDS_THERMOSTAT,
-    HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC,
-    HEATMISER_TYPE_IDS_TIMER,
+    ATTR_COOL_TEMPERATURES,
+    ATTR_TEMPERATURES,
     SERVICE_HUB_AWAY,
+    SERVICE_SET_ZONE_TEMPERATURES,
 )
 from .coordinator import HeatmiserNeoCoordinator
 from .entity import (
@@ -46,6 +44,7 @@ from .entity import (
     profile_sensor_enabled_by_default,
 )
 from .helpers import profile_level, set_away, set_holiday
+from .models import Capability, NeoDevice, as_float
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -129,6 +128,91 @@ async def async_set_away_mode(entity: HeatmiserNeoEntity, service_call: ServiceC
         entity.coordinator.live_data.HUB_HOLIDAY = holiday
 
 
+SET_ZONE_TEMPERATURES_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_TEMPERATURES): {cv.string: vol.Coerce(float)},
+        vol.Optional(ATTR_COOL_TEMPERATURES): {cv.string: vol.Coerce(float)},
+    }
+)
+
+
+def _group_zones_by_value(
+    entity: HeatmiserNeoEntity, zones: dict[str, float], required: Capability
+) -> dict[float, list[NeoDevice]]:
+    """Resolve zone names to devices and group them by their requested value.
+
+    Each value is checked against the temperature limits of its device, as
+    the climate entities do, since they depend on the device and the unit.
+    """
+    coordinator = entity.coordinator
+    devices, _ = coordinator.data
+    unknown = [
+        zone
+        for zone in zones
+        if zone not in devices
+        or coordinator.capabilities.get(zone, Capability(0)) & required != required
+    ]
+    if unknown:
+        raise HomeAssistantError(
+            f"Zones {', '.join(unknown)} do not exist or do not support this setting"
+        )
+    out_of_range = []
+    for zone, value in zones.items():
+        low = devices[zone].min_temperature_limit
+        high = devices[zone].max_temperature_limit
+        # Limits the hub does not report (NaN) do not reject anything.
+        if value < as_float(low) or value > as_float(high):
+            out_of_range.append(f"{zone} ({low}-{high})")
+    if out_of_range:
+        raise HomeAssistantError(
+            f"Temperatures outside the limits of zones {', '.join(out_of_range)}"
+        )
+    groups: dict[float, list[NeoDevice]] = {}
+    for zone, value in zones.items():
+        groups.setdefault(value, []).append(devices[zone])
+    return groups
+
+
+async def async_set_zone_temperatures(
+    entity: HeatmiserNeoEntity, service_call: ServiceCall
+):
+    """Set the target temperatures of many zones with one command per value."""
+    hub = entity.coordinator.hub
+    heat_groups = _group_zones_by_value(
+        entity, service_call.data[ATTR_TEMPERATURES], Capability.CLIMATE
+    )
+    cool_groups = _group_zones_by_value(
+        entity,
+        service_call.data.get(ATTR_COOL_TEMPERATURES, {}),
+        Capability.CLIMATE | Capability.CAN_COOL,
+    )
+
+    commands = [
+        (hub.set_target_temperature, "target_temperature", temperature, devices)
+        for temperature, devices in heat_groups.items()
+    ] + [
+        (hub.set_cool_temp, "cool_temp", temperature, devices)
+        for temperature, devices in cool_groups.items()
+    ]
+
+    try:
+        for index, (command, field, temperature, devices) in enumerate(commands):
+            try:
+                await command(temperature, devices)
+            except NeoHubConnectionError as err:
+                not_updated = sorted(
+                    {device.name for *_, group in commands[index:] for device in group}
+                )
+                raise HomeAssistantError(
+                    f"Zones {', '.join(not_updated)} were not updated: {err}"
+                ) from err
+            for device in devices:
+                entity.coordinator.set_optimistic(device, **{field: temperature})
+    finally:
+        entity.coordinator.async_update_listeners()
+    await entity.coordinator.async_request_refresh()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HeatmiserNeoConfigEntry,
@@ -143,7 +227,6 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Binary Sensors")
 
@@ -153,12 +236,17 @@ async def async_setup_entry(
         if description.setup_filter_fn(coordinator)
     )
 
-    async_add_entities(
-        HeatmiserNeoBinarySensor(neodevice, coordinator, hub, description)
-        for description in BINARY_SENSORS
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoBinarySensor(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(
+                BINARY_SENSORS, devices
+            )
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -166,6 +254,11 @@ async def async_setup_entry(
         SET_AWAY_MODE_SCHEMA,
         call_custom_action,
     )
+    platform.async_register_entity_service(
+        SERVICE_SET_ZONE_TEMPERATURES,
+        SET_ZONE_TEMPERATURES_SCHEMA,
+        call_custom_action,
+    )
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -199,31 +292,27 @@ BINARY_SENSORS: tuple[HeatmiserNeoBinarySensorEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.OPENING,
         name=None,  # This is the main entity of the device
         value_fn=lambda device: bool(device.data.window_open),
-        setup_filter_fn=lambda device, _: device.device_type == 5,
+        capabilities=Capability.CONTACT_SENSOR,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_device_hold_active",
         entity_category=EntityCategory.DIAGNOSTIC,
         name="Hold Active",
         value_fn=lambda device: device.data.hold_on,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_HOLD
-        ),
+        capabilities=Capability.HOLD,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_battery_level_sensor",
         device_class=BinarySensorDeviceClass.BATTERY,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.data.low_battery,
-        setup_filter_fn=lambda device, _: device.battery_powered,
+        capabilities=Capability.BATTERY,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_device_timer_output_active",
         name="Output",
         value_fn=lambda device: device.data.timer_on,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_TIMER and device.time_clock_mode
-        ),
+        capabilities=Capability.TIMER | Capability.TIME_CLOCK_MODE,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_device_away",
@@ -231,29 +320,21 @@ BINARY_SENSORS: tuple[HeatmiserNeoBinarySensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         name="Away",
         value_fn=lambda device: device.data.away or device.data.holiday,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_AWAY
-        ),
+        capabilities=Capability.AWAY,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_device_standby",
         entity_category=EntityCategory.DIAGNOSTIC,
         name="Standby",
         value_fn=lambda device: device.data.standby,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_STANDBY
-        ),
+        capabilities=Capability.STANDBY,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_floor_limit",
         entity_category=EntityCategory.DIAGNOSTIC,
         name="Floor Limit Reached",
         value_fn=lambda device: device.data.floor_limit,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-            and device.current_floor_temperature < 127
-        ),
+        capabilities=Capability.CLIMATE | Capability.FLOOR_SENSOR,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_temporary_set",
@@ -261,9 +342,7 @@ BINARY_SENSORS: tuple[HeatmiserNeoBinarySensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         name="Temporary Set",
         value_fn=lambda device: device.data.temporary_set_flag,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-        ),
+        capabilities=Capability.THERMOSTAT,
     ),
     HeatmiserNeoBinarySensorEntityDescription(
         key="heatmiser_neo_profile_current_state",
@@ -271,10 +350,7 @@ BINARY_SENSORS: tuple[HeatmiserNeoBinarySensorEntityDescription, ...] = (
         value_fn=lambda device: _profile_current_state(
             device.data.active_profile, device
         ),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-            and device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC | Capability.TIME_CLOCK_MODE,
         enabled_by_default_fn=profile_sensor_enabled_by_default,
     ),
 )
@@ -293,7 +369,10 @@ HUB_BINARY_SENSORS: tuple[HeatmiserNeoHubBinarySensorEntityDescription, ...] = (
         value_fn=lambda coordinator: (
             coordinator.live_data.HUB_AWAY or coordinator.live_data.HUB_HOLIDAY
         ),
-        custom_functions={SERVICE_HUB_AWAY: async_set_away_mode},
+        custom_functions={
+            SERVICE_HUB_AWAY: async_set_away_mode,
+            SERVICE_SET_ZONE_TEMPERATURES: async_set_zone_temperatures,
+        },
     ),
 )
 
@@ -303,7 +382,7 @@ class HeatmiserNeoBinarySensor(HeatmiserNeoEntity, BinarySensorEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoBinarySensorEntityDescription,
@@ -1,11 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
 """Heatmiser Neo Button platform."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 import logging
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 
 from homeassistant.components.button import (
     ButtonDeviceClass,
@@ -13,11 +13,10 @@ from homeassistant.components.button import (
     ButtonEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HeatmiserNeoConfigEntry
-from .const import HEATMISER_TYPE_IDS_IDENTIFY, HEATMISER_TYPE_IDS_REPEATER
 from .coordinator import HeatmiserNeoCoordinator
 from .entity import (
     HeatmiserNeoEntity,
@@ -25,6 +24,7 @@ from .entity import (
     HeatmiserNeoHubEntity,
     HeatmiserNeoHubEntityDescription,
 )
+from .models import Capability, NeoDevice
 
 
 async def async_setup_entry(
@@ -41,7 +41,6 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Device Buttons")
 
@@ -51,12 +50,15 @@ async def async_setup_entry(
         if description.setup_filter_fn(coordinator)
     )
 
-    async_add_entities(
-        HeatmiserNeoButton(neodevice, coordinator, hub, description)
-        for description in BUTTONS
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoButton(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(BUTTONS, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -80,6 +82,13 @@ class HeatmiserNeoHubButtonEntityDescription(
     press_fn: Callable[[HeatmiserNeoCoordinator], Awaitable[None]]
 
 
+async def async_identify_device(entity: HeatmiserNeoEntity):
+    """Flash the LEDs of a device."""
+    message = {"IDENTIFY_DEV": entity.data.name}
+    reply = {"result": "Device identifying"}
+    return await entity.coordinator.hub._send(message, reply)  # noqa: SLF001
+
+
 async def async_remove_repeater(entity: HeatmiserNeoEntity):
     """Handle repeater removal."""
     return await entity.coordinator.hub.remove_repeater(entity.data.device_id)
@@ -90,19 +99,15 @@ BUTTONS: tuple[HeatmiserNeoButtonEntityDescription, ...] = (
         key="heatmiser_neo_identify_button",
         device_class=ButtonDeviceClass.IDENTIFY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_IDENTIFY
-        ),
-        press_fn=lambda dev: dev.data.identify(),
+        capabilities=Capability.IDENTIFY,
+        press_fn=async_identify_device,
     ),
     HeatmiserNeoButtonEntityDescription(
         key="heatmiser_repeater_remove",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         name="Remove",
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_REPEATER
-        ),
+        capabilities=Capability.REPEATER,
         press_fn=async_remove_repeater,
     ),
 )
@@ -123,7 +128,7 @@ class HeatmiserNeoButton(HeatmiserNeoEntity, ButtonEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoButtonEntityDescription,
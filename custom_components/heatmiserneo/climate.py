@@ -3,12 +3,13 @@
 
 import asyncio
 from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import timedelta
 import logging
 from typing import Any
 
-from neohubapi.neohub import HCMode, NeoHub, NeoStat
+from neohubapi.neohub import HCMode, NeoHub, NeoHubConnectionError
 import voluptuous as vol
 
 from homeassistant.components.climate import (
@@ -30,39 +31,66 @@ from homeassistant.components.climate import (
     UnitOfTemperature,
 )
 from homeassistant.const import ATTR_TEMPERATURE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import slugify
 
 from . import HeatmiserNeoConfigEntry, hold_duration_validation
 from .const import (
     ATTR_HOLD_DURATION,
     ATTR_HOLD_TEMPERATURE,
+    CONF_CUSTOM_GROUPS,
     CONF_DEFAULTS,
+    CONF_GROUPS,
+    CONF_HUB_GROUPS,
     CONF_HVAC_MODES,
     CONF_STAT_HOLD_DURATION,
     CONF_STAT_HOLD_TEMP,
+    CONF_STAT_SETPOINT_DELAY,
     CONF_THERMOSTAT_OPTIONS,
     DEFAULT_NEOSTAT_HOLD_DURATION,
+    DEFAULT_NEOSTAT_SETPOINT_DELAY,
     DEFAULT_NEOSTAT_TEMPERATURE_BOOST,
     DOMAIN,
     HEATMISER_FAN_SPEED_HA_FAN_MODE,
     HEATMISER_TEMPERATURE_UNIT_HA_UNIT,
     HEATMISER_TYPE_IDS_HC,
-    HEATMISER_TYPE_IDS_THERMOSTAT,
     PRESET_STANDBY,
     SERVICE_HOLD_OFF,
     SERVICE_HOLD_ON,
+    SIGNAL_OPTIONS_UPDATED,
     AvailableMode,
+    FanControl,
     GlobalSystemType,
 )
-from .entity import HeatmiserNeoEntity, HeatmiserNeoEntityDescription
+from .coordinator import HeatmiserNeoCoordinator
+from .entity import (
+    HeatmiserNeoEntity,
+    HeatmiserNeoEntityDescription,
+    HeatmiserNeoHubEntity,
+    HeatmiserNeoHubEntityDescription,
+)
+from .models import Capability, NeoDevice, as_float, device_hvac_action
 
 _LOGGER = logging.getLogger(__name__)
 
 
+HOLD_ON_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_HOLD_DURATION, default=1): hold_duration_validation,
+        vol.Required(ATTR_HOLD_TEMPERATURE, default=20): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=35)
+        ),
+    }
+)
+HOLD_OFF_SCHEMA = cv.make_entity_service_schema({})
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HeatmiserNeoConfigEntry,
@@ -79,16 +107,7 @@ async def async_setup_entry(
     neo_devices, _ = coordinator.data
     system_data = coordinator.system_data
 
-    hvac_config = entry.options.get(CONF_HVAC_MODES, {})
-    defaults = entry.options.get(CONF_DEFAULTS, {}).get(
-        CONF_THERMOSTAT_OPTIONS,
-        {
-            CONF_STAT_HOLD_DURATION: DEFAULT_NEOSTAT_HOLD_DURATION,
-            CONF_STAT_HOLD_TEMP: DEFAULT_NEOSTAT_TEMPERATURE_BOOST,
-        },
-    )
-
-    _LOGGER.debug("hvac_config: %s", hvac_config)
+    _LOGGER.debug("hvac_config: %s", entry.options.get(CONF_HVAC_MODES, {}))
 
     temperature_unit = HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(
         system_data.CORF, UnitOfTemperature.CELSIUS
@@ -97,39 +116,76 @@ async def async_setup_entry(
 
     _LOGGER.info("Adding Neo Climate Entities")
 
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        hvac_config = entry.options.get(CONF_HVAC_MODES, {})
+        defaults = _thermostat_defaults(entry.options)
+        async_add_entities(
+            NeoStatEntity(
+                neodevice,
+                coordinator,
+                hub,
+                description,
+                temperature_unit,
+                float(temperature_step),
+                hvac_config.get(neodevice.name, None),
+                defaults,
+            )
+            for neodevice, description in coordinator.entity_plan(CLIMATE, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
+
+    groups = await _async_zone_groups(entry.options, coordinator)
     async_add_entities(
-        NeoStatEntity(
-            neodevice,
+        NeoGroupEntity(
             coordinator,
             hub,
-            description,
+            HeatmiserNeoClimateGroupEntityDescription(
+                key=f"heatmiser_neohub_group_{slugify(name)}",
+                name=name,
+            ),
+            zones,
             temperature_unit,
             float(temperature_step),
-            hvac_config.get(name, None),
-            defaults,
         )
-        for description in CLIMATE
-        for name, neodevice in neo_devices.items()
-        if description.setup_filter_fn(neodevice, system_data)
+        for name, zones in groups.items()
     )
 
     platform = entity_platform.async_get_current_platform()
 
+    platform.async_register_entity_service(SERVICE_HOLD_ON, HOLD_ON_SCHEMA, "set_hold")
+
     platform.async_register_entity_service(
-        SERVICE_HOLD_ON,
-        {
-            vol.Required(ATTR_HOLD_DURATION, default=1): hold_duration_validation,
-            vol.Required(ATTR_HOLD_TEMPERATURE, default=20): vol.All(
-                vol.Coerce(float), vol.Range(min=0, max=35)
-            ),
-        },
-        "set_hold",
+        SERVICE_HOLD_OFF, HOLD_OFF_SCHEMA, "unset_hold"
     )
 
-    platform.async_register_entity_service(
-        SERVICE_HOLD_OFF,
-        {},
-        "unset_hold",
+
+async def _async_zone_groups(
+    options: Mapping[str, Any], coordinator: HeatmiserNeoCoordinator
+) -> dict[str, list[str]]:
+    """Return the zone groups to create group entities for, with their zones."""
+    config = options.get(CONF_GROUPS, {})
+    groups: dict[str, list[str]] = {}
+    if config.get(CONF_HUB_GROUPS):
+        try:
+            groups.update(await coordinator.async_get_zone_groups())
+        except NeoHubConnectionError as err:
+            _LOGGER.warning("Could not get the zone groups of the hub: %s", err)
+    # Groups defined in the options take precedence over hub groups.
+    groups.update(config.get(CONF_CUSTOM_GROUPS, {}))
+    return groups
+
+
+def _thermostat_defaults(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the thermostat defaults from the config entry options."""
+    return options.get(CONF_DEFAULTS, {}).get(
+        CONF_THERMOSTAT_OPTIONS,
+        {
+            CONF_STAT_HOLD_DURATION: DEFAULT_NEOSTAT_HOLD_DURATION,
+            CONF_STAT_HOLD_TEMP: DEFAULT_NEOSTAT_TEMPERATURE_BOOST,
+        },
     )
 
 
@@ -140,18 +196,129 @@ class HeatmiserNeoClimateEntityDescription(
     """Describes a Climate entity."""
 
 
+@dataclass(frozen=True, kw_only=True)
+class HeatmiserNeoClimateGroupEntityDescription(
+    HeatmiserNeoHubEntityDescription, ClimateEntityDescription
+):
+    """Describes a zone group Climate entity."""
+
+
 CLIMATE: tuple[HeatmiserNeoClimateEntityDescription, ...] = (
     HeatmiserNeoClimateEntityDescription(
         key="heatmiser_neostat",
         name=None,  # Use device name
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.CLIMATE,
     ),
 )
 
 
+@dataclass(slots=True)
+class NeoStatView:
+    """Normalised values derived from a device snapshot once per coordinator update."""
+
+    current_temperature: float | None
+    hvac_action: HVACAction
+    hvac_mode: HVACMode
+    preset_mode: str
+    fan_mode: str
+    target_temperature: float | None
+    target_temperature_high: float | None
+
+
+def _current_temperature(
+    device: NeoDevice, unit_of_measurement: UnitOfTemperature
+) -> float | None:
+    """Validate the current temperature reported by a device."""
+    if device.offline:
+        return None
+
+    temperature = float(device.temperature)
+    # Checking for unreasonable temperatures, happens on hub disconnection.
+    # Centigrade
+    if (
+        temperature < -50.0 or temperature > 70.0
+    ) and unit_of_measurement == UnitOfTemperature.CELSIUS:
+        _LOGGER.error(
+            "Error: Climate entity '%s' has an invalid current_temperature value: %s degrees Centigrade, Hub lost connection?",
+            device.name,
+            device.temperature,
+        )
+        return None
+
+    # Fahrenheit
+    if (
+        temperature < -58.0 or temperature > 158.0
+    ) and unit_of_measurement == UnitOfTemperature.FAHRENHEIT:
+        _LOGGER.error(
+            "Error: Climate entity '%s' has an invalid current_temperature value: %s degrees Fahrenheit, Hub lost connection?",
+            device.name,
+            device.temperature,
+        )
+        return None
+
+    return temperature
+
+
+def _hvac_mode(device: NeoDevice) -> HVACMode:
+    """Return The current operation (e.g. heat, cool, idle)."""
+    if device.device_type in HEATMISER_TYPE_IDS_HC:
+        if device.hc_mode == "COOLING":
+            return HVACMode.COOL
+        if device.hc_mode == "AUTO":
+            return HVACMode.HEAT_COOL
+        if device.hc_mode == "VENT":
+            return HVACMode.FAN_ONLY
+    return HVACMode.HEAT
+
+
+def _preset_mode(device: NeoDevice) -> str:
+    """Return the preset_mode."""
+    if device.hold_on:
+        return PRESET_BOOST
+    if device.standby:
+        return PRESET_STANDBY
+    if device.away or device.holiday:
+        return PRESET_AWAY
+    return PRESET_HOME
+
+
+_HA_FAN_MODE_FAN_SPEED = {
+    fan_mode: fan_speed
+    for fan_speed, fan_mode in HEATMISER_FAN_SPEED_HA_FAN_MODE.items()
+}
+
+
+def _fan_mode(device: NeoDevice) -> str:
+    """Return the fan setting."""
+    if device.fan_control != "Manual":
+        return FAN_AUTO
+    return HEATMISER_FAN_SPEED_HA_FAN_MODE.get(device.fan_speed, FAN_OFF)
+
+
+def _target(value: Any, hvac_action: HVACAction) -> float | None:
+    """Return a target temperature, unless the device is off or the value unset."""
+    target = float(value)
+    if hvac_action != HVACAction.OFF and target < 255:
+        return target
+    return None
+
+
+def build_neostat_view(
+    device: NeoDevice, unit_of_measurement: UnitOfTemperature
+) -> NeoStatView:
+    """Compute the derived climate values for a device."""
+    hvac_action = device_hvac_action(device)
+    return NeoStatView(
+        current_temperature=_current_temperature(device, unit_of_measurement),
+        hvac_action=hvac_action,
+        hvac_mode=_hvac_mode(device),
+        preset_mode=_preset_mode(device),
+        fan_mode=_fan_mode(device),
+        target_temperature=_target(device.target_temperature, hvac_action),
+        target_temperature_high=_target(device.cool_temp, hvac_action),
+    )
+
+
 class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
     """Represents a Heatmiser neoStat thermostat."""
 
@@ -160,7 +327,7 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: DataUpdateCoordinator,
         hub: NeoHub,
         entity_descriptor: HeatmiserNeoClimateEntityDescription,
@@ -187,7 +354,21 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
             PRESET_AWAY,
             PRESET_STANDBY,
         ]
+        self._apply_options(hvac_modes_override, defaults)
+        self._view = build_neostat_view(self.data, unit_of_measurement)
+        self._pending_setpoints: dict[str, float] = {}
+        self._setpoint_timer: asyncio.TimerHandle | None = None
+        self._setpoint_written: asyncio.Future[None] | None = None
+
+    def _apply_options(
+        self, hvac_modes_override: list[str] | None, defaults: dict[str, Any]
+    ) -> None:
+        """Set the HVAC modes, supported features and defaults from the options."""
         self._defaults = defaults
+        self._setpoint_delay = float(
+            defaults.get(CONF_STAT_SETPOINT_DELAY, DEFAULT_NEOSTAT_SETPOINT_DELAY)
+        )
+        self._attr_fan_modes = None
         supported_features = ClimateEntityFeature.PRESET_MODE
 
         hvac_modes = []
@@ -236,6 +417,43 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
         self._attr_hvac_modes = hvac_modes
         self._attr_supported_features = supported_features
 
+    async def async_added_to_hass(self) -> None:
+        """Apply option changes without reloading the entry."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+
+    @callback
+    def _async_options_updated(self) -> None:
+        """Recompute the HVAC modes and defaults from the new options."""
+        options = self.coordinator.config_entry.options
+        self._apply_options(
+            options.get(CONF_HVAC_MODES, {}).get(self._neodevice.name),
+            _thermostat_defaults(options),
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the device view once per update."""
+        if self.data:
+            self._view = build_neostat_view(self.data, self.temperature_unit)
+        super()._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a setpoint write that has not been sent yet."""
+        if self._setpoint_timer:
+            self._setpoint_timer.cancel()
+            self._setpoint_timer = None
+        if self._setpoint_written and not self._setpoint_written.done():
+            self._setpoint_written.cancel()
+        await super().async_will_remove_from_hass()
+
     async def async_set_hvac_mode(self, hvac_mode):
         """Set hvac mode."""
         _LOGGER.info("%s : Executing set_hvac_mode() with: %s", self.name, hvac_mode)
@@ -254,8 +472,8 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
                 _LOGGER.warning(
                     "Standby is now a preset. Please use set_preset_mode instead"
                 )
-                await self.data.set_frost(False)
-                self.data.standby = False
+                await self._hub.set_frost(False, [self.data])
+                self.coordinator.set_optimistic(self.data, standby=False)
                 self.coordinator.async_update_listeners()
                 return None
             raise HomeAssistantError("Only NeoStat HC devices allow changing HVAC_MODE")
@@ -283,7 +501,9 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
             _LOGGER.warning("No mapping for mode %s", hvac_mode)
             return None
 
-        set_hc_mode_task = asyncio.create_task(self.data.set_hc_mode(hc_mode))
+        set_hc_mode_task = asyncio.create_task(
+            self._hub.set_hc_mode(hc_mode, [self.data])
+        )
         response = await set_hc_mode_task
         _LOGGER.info(
             "%s : Called set_hc_mode() with: %s (response: %s)",
@@ -291,7 +511,8 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
             hc_mode,
             response,
         )
-        self.data.hc_mode = hc_mode
+        # HCMode is a plain Enum; the hub reports the mode as its string value.
+        self.coordinator.set_optimistic(self.data, hc_mode=hc_mode.value)
         self.coordinator.async_update_listeners()
         return await self.coordinator.async_request_refresh()
 
@@ -300,69 +521,95 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
         _LOGGER.info("%s : Executing set_temperature() with:  %s", self.name, kwargs)
         _LOGGER.debug("self.data:  %s", self.data)
 
-        low_temp = kwargs.get(ATTR_TEMPERATURE) or kwargs.get(ATTR_TARGET_TEMP_LOW)
+        low_temp = kwargs.get(ATTR_TEMPERATURE, kwargs.get(ATTR_TARGET_TEMP_LOW))
         high_temp = kwargs.get(ATTR_TARGET_TEMP_HIGH)
 
-        if low_temp:
-            set_target_temperature_task = asyncio.create_task(
-                self.data.set_target_temperature(low_temp)
-            )
-            response = await set_target_temperature_task
-            if response:
-                _LOGGER.info(
-                    "%s : Called set_target_temperature with: %s (response: %s)",
-                    self.name,
-                    low_temp,
-                    response,
-                )
-
-        if high_temp:
-            set_target_cool_temperature_task = asyncio.create_task(
-                self.data.set_cool_temp(high_temp)
-            )
-            response = await set_target_cool_temperature_task
-            if response:
-                _LOGGER.info(
-                    "%s : Called set_cool_temp with: %s (response: %s)",
-                    self.name,
-                    high_temp,
-                    response,
-                )
-
-        # The change of target temperature may trigger a change in the current hvac_action
-        # so we schedule a refresh to get new data asap.
-        await self.coordinator.async_request_refresh()
+        # Dragging a thermostat card sends a burst of calls. Only the latest
+        # setpoints are kept and sent once no change has arrived for the
+        # configured delay. Every caller waits for that single write.
+        if low_temp is not None:
+            self._pending_setpoints[ATTR_TARGET_TEMP_LOW] = low_temp
+        if high_temp is not None:
+            self._pending_setpoints[ATTR_TARGET_TEMP_HIGH] = high_temp
+        if not self._pending_setpoints:
+            return
+
+        loop = self.hass.loop
+        if self._setpoint_timer:
+            self._setpoint_timer.cancel()
+        if self._setpoint_written is None:
+            self._setpoint_written = loop.create_future()
+        written = self._setpoint_written
+        self._setpoint_timer = loop.call_later(
+            self._setpoint_delay,
+            lambda: self.hass.async_create_task(self._async_write_setpoints()),
+        )
+        await written
+
+    async def _async_write_setpoints(self) -> None:
+        """Send the latest requested setpoints to the hub."""
+        if self._setpoint_timer:
+            # A call made after the timer fired but before this task ran
+            # scheduled another timer; this write covers it.
+            self._setpoint_timer.cancel()
+            self._setpoint_timer = None
+        written, self._setpoint_written = self._setpoint_written, None
+        setpoints, self._pending_setpoints = self._pending_setpoints, {}
+        if written is None or not setpoints:
+            return
+
+        sent = False
+        try:
+            device = self.data
+            if device is None:
+                raise HomeAssistantError(f"{self.name} is not connected to the hub")
+
+            low_temp = setpoints.get(ATTR_TARGET_TEMP_LOW)
+            if low_temp is not None and not self.coordinator.already_set(
+                device, target_temperature=low_temp
+            ):
+                response = await self._hub.set_target_temperature(low_temp, [device])
+                sent = True
+                self.coordinator.set_optimistic(device, target_temperature=low_temp)
+                if response:
+                    _LOGGER.info(
+                        "%s : Called set_target_temperature with: %s (response: %s)",
+                        self.name,
+                        low_temp,
+                        response,
+                    )
+
+            high_temp = setpoints.get(ATTR_TARGET_TEMP_HIGH)
+            if high_temp is not None and not self.coordinator.already_set(
+                device, cool_temp=high_temp
+            ):
+                response = await self._hub.set_cool_temp(high_temp, [device])
+                sent = True
+                self.coordinator.set_optimistic(device, cool_temp=high_temp)
+                if response:
+                    _LOGGER.info(
+                        "%s : Called set_cool_temp with: %s (response: %s)",
+                        self.name,
+                        high_temp,
+                        response,
+                    )
+        except Exception as err:  # noqa: BLE001
+            if not written.done():
+                written.set_exception(err)
+            return
+        finally:
+            if not written.done():
+                written.set_result(None)
+
+        if sent:
+            # The change of target temperature may trigger a change in the current hvac_action
+            # so we schedule a refresh to get new data asap.
+            await self.coordinator.async_request_refresh()
 
     @property
     def current_temperature(self):
         """Returns the current temperature."""
-        if self.data.offline:
-            return None
-
-        # Checking for unreasonable temperatures, happens on hub disconnection.
-        # Centigrade
-        if (
-            float(self.data.temperature) < -50.0 or float(self.data.temperature) > 70.0
-        ) and self.temperature_unit == UnitOfTemperature.CELSIUS:
-            _LOGGER.error(
-                "Error: Climate entity '%s' has an invalid current_temperature value: %s degrees Centigrade, Hub lost connection?",
-                self.data.name,
-                self.data.temperature,
-            )
-            return None
-
-        # Fahrenheit
-        if (
-            float(self.data.temperature) < -58.0 or float(self.data.temperature) > 158.0
-        ) and self.temperature_unit == UnitOfTemperature.FAHRENHEIT:
-            _LOGGER.error(
-                "Error: Climate entity '%s' has an invalid current_temperature value: %s degrees Fahrenheit, Hub lost connection?",
-                self.data.name,
-                self.data.temperature,
-            )
-            return None
-
-        return float(self.data.temperature)
+        return self._view.current_temperature
 
     @property
     def extra_state_attributes(self):
@@ -385,33 +632,13 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
 
     @property
     def hvac_action(self):
-        # See: https://developers.home-assistant.io/docs/core/entity/climate/
         """The current HVAC action (heating, cooling)."""
-        if self.data.preheat_active:
-            return HVACAction.PREHEATING
-        if self.data.cool_on:
-            return HVACAction.COOLING
-        if self.data.heat_on:
-            return HVACAction.HEATING
-        if self.data.fan_speed != "Off":
-            return HVACAction.FAN  # Should fan be combined? Ie can you have fan on and other functions together?
-        if self.data.standby or self.data.away or self.data.holiday:
-            if self.data._data_.FROST_TEMP >= 127:
-                # If the frost protection temperature is not set, then the thermostat is truly off.
-                return HVACAction.OFF
-        return HVACAction.IDLE
+        return self._view.hvac_action
 
     @property
     def hvac_mode(self):
         """Return The current operation (e.g. heat, cool, idle). Used to determine state."""
-        if self.data.device_type in HEATMISER_TYPE_IDS_HC:
-            if self.data.hc_mode == "COOLING":
-                return HVACMode.COOL
-            if self.data.hc_mode == "AUTO":
-                return HVACMode.HEAT_COOL
-            if self.data.hc_mode == "VENT":
-                return HVACMode.FAN_ONLY
-        return HVACMode.HEAT
+        return self._view.hvac_mode
 
     async def set_hold(self, hold_duration: timedelta, hold_temperature: float):
         """Set Hold for Zone."""
@@ -427,75 +654,66 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
         hold_minutes = min(hold_minutes, 60 * 99)
         hold_hours, hold_minutes = divmod(hold_minutes, 60)
 
-        result = await self._hub.set_hold(
-            hold_temperature, hold_hours, hold_minutes, [self.data]
-        )
-
-        # Optimistically update the mode so that the UI feels snappy.
-        # The value will be confirmed next time we get new data.
+        device = self.data
 
-        self.data.hold_on = True
-        self.data.hold_time = timedelta(hours=hold_hours, minutes=hold_minutes)
-        self.data.hold_temp = hold_temperature
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        def optimistic() -> None:
+            self.coordinator.set_optimistic(
+                device, hold_on=True, hold_temp=hold_temperature
+            )
+            device.hold_time = timedelta(hours=hold_hours, minutes=hold_minutes)
 
-        return result
+        return await self.coordinator.async_device_command(
+            "set_hold",
+            hold_temperature,
+            hold_hours,
+            hold_minutes,
+            device=device,
+            optimistic=optimistic,
+            refresh=True,
+        )
 
     async def unset_hold(self):
         """Unsets Hold for Zone."""
-        result = await self._hub.set_hold(self.data.hold_temp, 0, 0, [self.data])
-
-        # Optimistically update the mode so that the UI feels snappy.
-        # The value will be confirmed next time we get new data.
-        self.data.hold_on = False
-        self.data.hold_time = timedelta(minutes=0)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        device = self.data
 
-        return result
+        def optimistic() -> None:
+            self.coordinator.set_optimistic(device, hold_on=False)
+            device.hold_time = timedelta(minutes=0)
+
+        return await self.coordinator.async_device_command(
+            "set_hold",
+            device.hold_temp,
+            0,
+            0,
+            device=device,
+            optimistic=optimistic,
+            refresh=True,
+        )
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        target = float(self.data.target_temperature)
-        if self.hvac_action != HVACAction.OFF and target < 255:
-            return target
-        return None
+        return self._view.target_temperature
 
     @property
     def target_temperature_high(self):
         """Return the temperature we try to reach."""
-        target = float(self.data.cool_temp)
-        if self.hvac_action != HVACAction.OFF and target < 255:
-            return target
-        return None
+        return self._view.target_temperature_high
 
     @property
     def target_temperature_low(self):
         """Return the temperature we try to reach."""
-        target = float(self.data.target_temperature)
-        if self.hvac_action != HVACAction.OFF and target < 255:
-            return target
-        return None
+        return self._view.target_temperature
 
     @property
     def preset_mode(self) -> str:
         """Return the preset_mode."""
-        if self.data.hold_on:
-            return PRESET_BOOST
-        if self.data.standby:
-            return PRESET_STANDBY
-        if self.data.away or self.data.holiday:
-            return PRESET_AWAY
-        return PRESET_HOME
+        return self._view.preset_mode
 
     @property
     def fan_mode(self) -> str | None:
         """Return the fan setting."""
-        if self.data.fan_control != "Manual":
-            return FAN_AUTO
-        return HEATMISER_FAN_SPEED_HA_FAN_MODE.get(self.data.fan_speed, FAN_OFF)
+        return self._view.fan_mode
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode/speed."""
@@ -508,7 +726,19 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
             mode = "LOW"
         elif fan_mode == FAN_AUTO:
             mode = "AUTO"
-        await self.data.set_fan_speed(mode)
+        if fan_mode == FAN_AUTO:
+            fields = {"fan_control": FanControl.AUTOMATIC.value}
+        else:
+            fields = {
+                "fan_control": FanControl.MANUAL.value,
+                "fan_speed": _HA_FAN_MODE_FAN_SPEED[fan_mode],
+            }
+        device = self.data
+        if self.coordinator.already_set(device, **fields):
+            return
+        await self._hub.set_fan_speed(mode, [device])
+        self.coordinator.set_optimistic(device, **fields)
+        self.coordinator.async_update_listeners()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
@@ -517,11 +747,11 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
         if preset_mode == PRESET_STANDBY:
             disable_away = False
             if not device.standby:
-                await device.set_frost(True)
-                device.standby = True
+                await self._hub.set_frost(True, [device])
+                self.coordinator.set_optimistic(device, standby=True)
         elif device.standby:
-            await device.set_frost(False)
-            device.standby = False
+            await self._hub.set_frost(False, [device])
+            self.coordinator.set_optimistic(device, standby=False)
 
         if preset_mode == PRESET_AWAY:
             await self.async_set_away_mode()
@@ -544,8 +774,221 @@ class NeoStatEntity(HeatmiserNeoEntity, ClimateEntity):
         if device.hold_on != hold_on:
             hold_hours, hold_minutes = divmod(hold_duration, 60)
             await self._hub.set_hold(hold_temp, hold_hours, hold_minutes, [device])
-            device.hold_temp = hold_temp
-            device.hold_on = hold_on
+            self.coordinator.set_optimistic(
+                device, hold_temp=hold_temp, hold_on=hold_on
+            )
             device.hold_time = timedelta(minutes=hold_duration)
 
         self.coordinator.async_update_listeners()
+
+
+@dataclass(slots=True)
+class NeoGroupView:
+    """Aggregated values of the thermostats in a zone group."""
+
+    current_temperature: float | None
+    target_temperature: float | None
+    hvac_action: HVACAction | None
+    hvac_mode: HVACMode | None
+    zones_heating: int
+    zones_on_hold: int
+
+
+def build_group_view(
+    devices: list[NeoDevice], unit_of_measurement: UnitOfTemperature
+) -> NeoGroupView:
+    """Compute the aggregated climate values of a zone group."""
+    online = [device for device in devices if not device.offline]
+    temperatures = [
+        temperature
+        for device in online
+        if (temperature := _current_temperature(device, unit_of_measurement))
+        is not None
+    ]
+    targets = [
+        target
+        for device in online
+        if not device.standby and (target := as_float(device.target_temperature)) < 255
+    ]
+    actions = [device_hvac_action(device) for device in online]
+
+    if HVACAction.HEATING in actions:
+        hvac_action = HVACAction.HEATING
+    elif HVACAction.PREHEATING in actions:
+        hvac_action = HVACAction.PREHEATING
+    elif actions and all(action == HVACAction.OFF for action in actions):
+        hvac_action = HVACAction.OFF
+    else:
+        hvac_action = HVACAction.IDLE if actions else None
+
+    if not online:
+        hvac_mode = None
+    elif all(device.standby for device in online):
+        hvac_mode = HVACMode.OFF
+    else:
+        hvac_mode = HVACMode.HEAT
+
+    return NeoGroupView(
+        current_temperature=round(sum(temperatures) / len(temperatures), 1)
+        if temperatures
+        else None,
+        target_temperature=round(sum(targets) / len(targets), 1) if targets else None,
+        hvac_action=hvac_action,
+        hvac_mode=hvac_mode,
+        zones_heating=actions.count(HVACAction.HEATING),
+        zones_on_hold=sum(1 for device in online if device.hold_on),
+    )
+
+
+class NeoGroupEntity(HeatmiserNeoHubEntity, ClimateEntity):
+    """Represents a group of thermostats, controlled with single hub commands."""
+
+    entity_description: HeatmiserNeoClimateGroupEntityDescription
+    _enable_turn_on_off_backwards_compatibility = False
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+
+    def __init__(
+        self,
+        coordinator: HeatmiserNeoCoordinator,
+        hub: NeoHub,
+        entity_description: HeatmiserNeoClimateGroupEntityDescription,
+        zones: list[str],
+        unit_of_measurement: UnitOfTemperature,
+        temperature_step: float,
+    ) -> None:
+        """Initialize the zone group Climate entity."""
+        super().__init__(coordinator, hub, entity_description)
+        self._zones = zones
+        self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
+        self._attr_temperature_unit = unit_of_measurement
+        self._attr_target_temperature_step = temperature_step
+        if members := self.members:
+            self._attr_min_temp = min(d.min_temperature_limit for d in members)
+            self._attr_max_temp = max(d.max_temperature_limit for d in members)
+        self._view = build_group_view(members, unit_of_measurement)
+
+    @property
+    def members(self) -> list[NeoDevice]:
+        """Return the thermostats of the group that are on the hub."""
+        devices, _ = self.coordinator.data
+        capabilities = self.coordinator.capabilities
+        return [
+            devices[zone]
+            for zone in self._zones
+            if zone in devices
+            and capabilities.get(zone, Capability(0)) & Capability.CLIMATE
+            == Capability.CLIMATE
+        ]
+
+    @property
+    def available(self) -> bool:
+        """Return whether any thermostat of the group is online."""
+        return self._view.hvac_mode is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the group view once per update."""
+        self._view = build_group_view(self.members, self.temperature_unit)
+        super()._handle_coordinator_update()
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the mean temperature of the group."""
+        return self._view.current_temperature
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return the setpoint of the group."""
+        return self._view.target_temperature
+
+    @property
+    def hvac_action(self) -> HVACAction | None:
+        """Return heating if any thermostat of the group is calling for heat."""
+        return self._view.hvac_action
+
+    @property
+    def hvac_mode(self) -> HVACMode | None:
+        """Return off if all the thermostats of the group are on standby."""
+        return self._view.hvac_mode
+
+    @property
+    def extra_state_attributes(self):
+        """Return the additional state attributes."""
+        return {
+            "zones": [device.name for device in self.members],
+            "zones_heating": self._view.zones_heating,
+            "zones_on_hold": self._view.zones_on_hold,
+            "hold_on": self._view.zones_on_hold > 0,
+        }
+
+    async def async_set_temperature(self, **kwargs):
+        """Set the target temperature of every thermostat in the group."""
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is None:
+            return
+        devices = [
+            device
+            for device in self.members
+            if not self.coordinator.already_set(device, target_temperature=temperature)
+        ]
+        if not devices:
+            return
+        await self._hub.set_target_temperature(temperature, devices)
+        for device in devices:
+            self.coordinator.set_optimistic(device, target_temperature=temperature)
+        self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Put the thermostats of the group on standby, or take them off it."""
+        standby = hvac_mode == HVACMode.OFF
+        devices = [device for device in self.members if device.standby != standby]
+        if not devices:
+            return
+        await self._hub.set_frost(standby, devices)
+        for device in devices:
+            self.coordinator.set_optimistic(device, standby=standby)
+        self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
+    async def set_hold(self, hold_duration: timedelta, hold_temperature: float):
+        """Set Hold for every thermostat in the group."""
+        hold_minutes = int(hold_duration.total_seconds() / 60)
+        hold_minutes = min(hold_minutes, 60 * 99)
+        hold_hours, hold_minutes = divmod(hold_minutes, 60)
+
+        devices = self.members
+        if not devices:
+            return
+        await self._hub.set_hold(hold_temperature, hold_hours, hold_minutes, devices)
+        for device in devices:
+            self.coordinator.set_optimistic(
+                device, hold_on=True, hold_temp=hold_temperature
+            )
+            device.hold_time = timedelta(hours=hold_hours, minutes=hold_minutes)
+        self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
+    async def unset_hold(self):
+        """Unset Hold for every thermostat in the group."""
+        # A hold is cleared by setting it again with no duration. Each device
+        # keeps its own hold temperature, so one command is sent per value.
+        groups: dict[Any, list[NeoDevice]] = {}
+        for device in self.members:
+            if device.hold_on:
+                groups.setdefault(device.hold_temp, []).append(device)
+        if not groups:
+            return
+        try:
+            for hold_temp, devices in groups.items():
+                await self._hub.set_hold(hold_temp, 0, 0, devices)
+                for device in devices:
+                    self.coordinator.set_optimistic(device, hold_on=False)
+                    device.hold_time = timedelta(minutes=0)
+        finally:
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
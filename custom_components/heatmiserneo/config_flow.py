@@ -6,7 +6,7 @@ from copy import deepcopy
 import logging
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoHubConnectionError
+from neohubapi.neohub import NeoHubConnectionError
 import voluptuous as vol
 
 from homeassistant.components.climate import UnitOfTemperature
@@ -15,6 +15,7 @@ from homeassistant.const import CONF_API_TOKEN, CONF_HOST, CONF_PORT
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     DurationSelector,
     DurationSelectorConfig,
     NumberSelector,
@@ -23,22 +24,32 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
 )
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from . import HeatmiserNeoConfigEntry, hold_duration_validation
 from .const import (
+    CONF_ADVANCED_OPTIONS,
     CONF_CONN_METHOD_LEGACY,
     CONF_CONN_METHOD_WEBSOCKET,
+    CONF_CUSTOM_GROUPS,
     CONF_DEFAULTS,
+    CONF_ENTITY_TIER,
+    CONF_GROUPS,
+    CONF_HUB_GROUPS,
     CONF_HVAC_MODES,
     CONF_STAT_HOLD_DURATION,
     CONF_STAT_HOLD_TEMP,
+    CONF_STAT_SETPOINT_DELAY,
     CONF_THERMOSTAT_OPTIONS,
     CONF_TIMER_HOLD_DURATION,
     CONF_TIMER_OPTIONS,
+    DEFAULT_ENTITY_TIER,
     DEFAULT_HOST,
     DEFAULT_NEOSTAT_HOLD_DURATION,
+    DEFAULT_NEOSTAT_SETPOINT_DELAY,
     DEFAULT_NEOSTAT_TEMPERATURE_BOOST,
     DEFAULT_PORT,
     DEFAULT_TIMER_HOLD_DURATION,
@@ -46,9 +57,12 @@ from .const import (
     DOMAIN,
     HEATMISER_TEMPERATURE_UNIT_HA_UNIT,
     HEATMISER_TYPE_IDS_HC,
+    HEATMISER_TYPE_IDS_THERMOSTAT,
     AvailableMode,
+    EntityTier,
     GlobalSystemType,
 )
+from .hub import async_get_hub, async_release_hub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,9 +111,13 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         """Try connection to NeoHub."""
         _LOGGER.debug("Trying connection to NeoHub")
         try:
-            hub = NeoHub(self._host, self._port, token=self._token)
-            await hub.firmware()
-            await hub.disconnect()
+            # The client stays connected for a while, so the entry setup that
+            # follows reuses its connection.
+            hub = async_get_hub(self.hass, self._host, self._port, self._token)
+            try:
+                await hub.firmware()
+            finally:
+                async_release_hub(self.hass, hub)
         except NeoHubConnectionError:
             return "cannot_connect"
         _LOGGER.debug("Connection Worked!")
@@ -218,6 +236,8 @@ class OptionsFlowHandler(OptionsFlow):
             )
         )
 
+        self._groups_config = deepcopy(config_entry.options.get(CONF_GROUPS, {}))
+
         devices, _ = config_entry.runtime_data.coordinator.data
         system_data = config_entry.runtime_data.coordinator.system_data
 
@@ -228,6 +248,14 @@ class OptionsFlowHandler(OptionsFlow):
                 if v.device_type in HEATMISER_TYPE_IDS_HC and not v.time_clock_mode
             ]
         )
+        self.neostats = sorted(
+            [
+                k
+                for k, v in devices.items()
+                if v.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
+                and not v.time_clock_mode
+            ]
+        )
 
         mandatory_modes = []
         system_modes = []
@@ -251,21 +279,84 @@ class OptionsFlowHandler(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the flow initiated by the user."""
-        if len(self.neostat_hcs) == 0:
-            return await self.async_step_defaults(user_input=user_input)
-
         return await self.async_step_choose_options(user_input=user_input)
 
     async def async_step_choose_options(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle local vs cloud mode selection step."""
-        return self.async_show_menu(
-            step_id="choose_options",
-            menu_options={
-                CONF_DEFAULTS: "Configure default settings for devices",
-                CONF_HVAC_MODES: "Configure HVAC modes for NeoStatHC",
-            },
+        menu_options = {
+            CONF_DEFAULTS: "Configure default settings for devices",
+            CONF_GROUPS: "Configure zone groups",
+        }
+        if self.neostat_hcs:
+            menu_options[CONF_HVAC_MODES] = "Configure HVAC modes for NeoStatHC"
+        return self.async_show_menu(step_id="choose_options", menu_options=menu_options)
+
+    async def async_step_groups(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the zone groups that get a group climate entity."""
+        errors: dict[str, str] = {}
+        placeholders = {"zones": ""}
+
+        if user_input is not None:
+            _LOGGER.debug("user_input: %s", user_input)
+            _LOGGER.debug("original config: %s", self._groups_config)
+
+            # One group per line, as "Name: zone, zone, ..."
+            custom_groups: dict[str, list[str]] = {}
+            for line in user_input.get(CONF_CUSTOM_GROUPS, "").splitlines():
+                if not line.strip():
+                    continue
+                name, separator, zone_list = line.partition(":")
+                zones = [zone.strip() for zone in zone_list.split(",") if zone.strip()]
+                if not separator or not name.strip() or not zones:
+                    errors[CONF_CUSTOM_GROUPS] = "invalid_group"
+                    break
+                if unknown := [zone for zone in zones if zone not in self.neostats]:
+                    errors[CONF_CUSTOM_GROUPS] = "unknown_zone"
+                    placeholders["zones"] = ", ".join(unknown)
+                    break
+                custom_groups[name.strip()] = zones
+
+            if not errors:
+                self._groups_config = {
+                    CONF_HUB_GROUPS: user_input[CONF_HUB_GROUPS],
+                    CONF_CUSTOM_GROUPS: custom_groups,
+                }
+                _LOGGER.debug("updated config: %s", self._groups_config)
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_HVAC_MODES: self._hvac_config,
+                        CONF_DEFAULTS: self._defaults_config,
+                        CONF_GROUPS: self._groups_config,
+                    },
+                )
+
+        custom_groups_text = "\n".join(
+            f"{name}: {', '.join(zones)}"
+            for name, zones in self._groups_config.get(CONF_CUSTOM_GROUPS, {}).items()
+        )
+        options_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_HUB_GROUPS,
+                    default=self._groups_config.get(CONF_HUB_GROUPS, False),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_CUSTOM_GROUPS,
+                    description={"suggested_value": custom_groups_text},
+                ): TextSelector(TextSelectorConfig(multiline=True)),
+            }
+        )
+
+        return self.async_show_form(
+            step_id=CONF_GROUPS,
+            data_schema=options_schema,
+            errors=errors,
+            description_placeholders=placeholders,
         )
 
     async def async_step_hvac_modes(
@@ -296,6 +387,7 @@ class OptionsFlowHandler(OptionsFlow):
                     data={
                         CONF_HVAC_MODES: self._hvac_config,
                         CONF_DEFAULTS: self._defaults_config,
+                        CONF_GROUPS: self._groups_config,
                     },
                 )
 
@@ -362,6 +454,7 @@ class OptionsFlowHandler(OptionsFlow):
                     data={
                         CONF_HVAC_MODES: self._hvac_config,
                         CONF_DEFAULTS: self._defaults_config,
+                        CONF_GROUPS: self._groups_config,
                     },
                 )
         temperature_step = (
@@ -406,6 +499,23 @@ class OptionsFlowHandler(OptionsFlow):
                                     unit_of_measurement=self._unit_of_measurement,
                                 )
                             ),
+                            vol.Required(
+                                CONF_STAT_SETPOINT_DELAY,
+                                default=self._defaults_config.get(
+                                    CONF_THERMOSTAT_OPTIONS, {}
+                                ).get(
+                                    CONF_STAT_SETPOINT_DELAY,
+                                    DEFAULT_NEOSTAT_SETPOINT_DELAY,
+                                ),
+                            ): NumberSelector(
+                                NumberSelectorConfig(
+                                    min=0,
+                                    max=10,
+                                    step=0.5,
+                                    mode=NumberSelectorMode.BOX,
+                                    unit_of_measurement="s",
+                                )
+                            ),
                         }
                     )
                 ),
@@ -432,6 +542,25 @@ class OptionsFlowHandler(OptionsFlow):
                         }
                     )
                 ),
+                vol.Required(CONF_ADVANCED_OPTIONS): section(
+                    vol.Schema(
+                        {
+                            vol.Required(
+                                CONF_ENTITY_TIER,
+                                default=self._defaults_config.get(
+                                    CONF_ADVANCED_OPTIONS, {}
+                                ).get(CONF_ENTITY_TIER, DEFAULT_ENTITY_TIER),
+                            ): SelectSelector(
+                                SelectSelectorConfig(
+                                    options=[tier.value for tier in EntityTier],
+                                    mode=SelectSelectorMode.LIST,
+                                    translation_key=CONF_ENTITY_TIER,
+                                )
+                            ),
+                        }
+                    ),
+                    {"collapsed": True},
+                ),
             }
         )
 
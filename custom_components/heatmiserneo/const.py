@@ -21,6 +21,7 @@ DEFAULT_WEBSOCKET_PORT = 4243
 DEFAULT_TIMER_HOLD_DURATION = 30
 DEFAULT_NEOSTAT_HOLD_DURATION = 30
 DEFAULT_NEOSTAT_TEMPERATURE_BOOST = 2
+DEFAULT_NEOSTAT_SETPOINT_DELAY = 1
 
 CONF_CONN_METHOD_WEBSOCKET = "conn_method_websocket"
 CONF_CONN_METHOD_LEGACY = "conn_method_legacy"
@@ -31,7 +32,16 @@ CONF_TIMER_OPTIONS = "timer_options"
 CONF_THERMOSTAT_OPTIONS = "thermostat_options"
 CONF_STAT_HOLD_DURATION = "stat_hold_duration"
 CONF_STAT_HOLD_TEMP = "stat_hold_temp"
+CONF_STAT_SETPOINT_DELAY = "stat_setpoint_delay"
 CONF_TIMER_HOLD_DURATION = "timer_hold_duration"
+CONF_ADVANCED_OPTIONS = "advanced_options"
+CONF_ENTITY_TIER = "entity_tier"
+CONF_GROUPS = "groups"
+CONF_HUB_GROUPS = "hub_groups"
+CONF_CUSTOM_GROUPS = "custom_groups"
+
+# Sent with the entry id when options that entities apply live have changed.
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
 
 SERVICE_HOLD_ON = "hold_on"
 SERVICE_HOLD_OFF = "hold_off"
@@ -46,45 +56,23 @@ SERVICE_CREATE_TIMER_PROFILE_TWO = "create_timer_profile_two"
 SERVICE_CREATE_TIMER_PROFILE_SEVEN = "create_timer_profile_seven"
 SERVICE_RENAME_PROFILE = "rename_profile"
 SERVICE_DELETE_PROFILE = "delete_profile"
+SERVICE_ASSIGN_PROFILE = "assign_profile"
 SERVICE_HUB_AWAY = "set_away_mode"
+SERVICE_SET_ZONE_TEMPERATURES = "set_zone_temperatures"
 ATTR_HOLD_DURATION = "hold_duration"
 ATTR_HOLD_STATE = "hold_state"
 ATTR_HOLD_TEMPERATURE = "hold_temperature"
 ATTR_AWAY_STATE = "away"
 # ATTR_AWAY_START = "start"
 ATTR_AWAY_END = "end"
+ATTR_TEMPERATURES = "temperatures"
+ATTR_COOL_TEMPERATURES = "cool_temperatures"
 ATTR_NAME_OLD = "old_name"
 ATTR_NAME_NEW = "new_name"
+ATTR_ZONES = "zones"
+ATTR_ZONE_GROUP = "zone_group"
 ATTR_FRIENDLY_MODE = "friendly_mode"
 ATTR_CREATE_MODE = "mode"
-ATTR_MONDAY_TIMES = "monday_times"
-ATTR_MONDAY_TEMPERATURES = "monday_temperatures"
-ATTR_TUESDAY_TIMES = "tuesday_times"
-ATTR_TUESDAY_TEMPERATURES = "tuesday_temperatures"
-ATTR_WEDNESDAY_TIMES = "wednesday_times"
-ATTR_WEDNESDAY_TEMPERATURES = "wednesday_temperatures"
-ATTR_THURSDAY_TIMES = "thursday_times"
-ATTR_THURSDAY_TEMPERATURES = "thursday_temperatures"
-ATTR_FRIDAY_TIMES = "friday_times"
-ATTR_FRIDAY_TEMPERATURES = "friday_temperatures"
-ATTR_SATURDAY_TIMES = "saturday_times"
-ATTR_SATURDAY_TEMPERATURES = "saturday_temperatures"
-ATTR_SUNDAY_TIMES = "sunday_times"
-ATTR_SUNDAY_TEMPERATURES = "sunday_temperatures"
-ATTR_MONDAY_ON_TIMES = "monday_on_times"
-ATTR_MONDAY_OFF_TIMES = "monday_off_times"
-ATTR_TUESDAY_ON_TIMES = "tuesday_on_times"
-ATTR_TUESDAY_OFF_TIMES = "tuesday_off_times"
-ATTR_WEDNESDAY_ON_TIMES = "wednesday_on_times"
-ATTR_WEDNESDAY_OFF_TIMES = "wednesday_off_times"
-ATTR_THURSDAY_ON_TIMES = "thursday_on_times"
-ATTR_THURSDAY_OFF_TIMES = "thursday_off_times"
-ATTR_FRIDAY_ON_TIMES = "friday_on_times"
-ATTR_FRIDAY_OFF_TIMES = "friday_off_times"
-ATTR_SATURDAY_ON_TIMES = "saturday_on_times"
-ATTR_SATURDAY_OFF_TIMES = "saturday_off_times"
-ATTR_SUNDAY_ON_TIMES = "sunday_on_times"
-ATTR_SUNDAY_OFF_TIMES = "sunday_off_times"
 
 OPTION_CREATE_MODE_CREATE = "create"
 OPTION_CREATE_MODE_UPDATE = "update"
@@ -164,6 +152,17 @@ class GlobalSystemType(str, enum.Enum):
     INDEPENDENT = "Independent"
 
 
+class EntityTier(str, enum.Enum):
+    """Sets of device entities to create, each including the previous one."""
+
+    CORE = "core"
+    EXTENDED = "extended"
+    FULL = "full"
+
+
+DEFAULT_ENTITY_TIER = EntityTier.FULL
+
+
 class ModeSelectOption(str, enum.Enum):
     """Operating mode options for NeoPlugs and NeoStats in timer mode."""
 
@@ -2,9 +2,12 @@
 """Coordinator object for the HeatmiserNeo integration."""
 
 import asyncio
-from collections.abc import Callable
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 import logging
+import time
+from typing import Any, Protocol
 
 from neohubapi.neohub import (
     ATTR_DEVICES,
@@ -15,21 +18,84 @@ from neohubapi.neohub import (
     ATTR_TIMER_PROFILES,
     ATTR_TIMER_PROFILES_0,
     NeoHub,
-    NeoStat,
 )
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CONF_ADVANCED_OPTIONS,
+    CONF_DEFAULTS,
+    CONF_ENTITY_TIER,
+    DEFAULT_ENTITY_TIER,
+    DOMAIN,
+    EntityTier,
+)
+from .history import (
+    HISTORY_RETENTION,
+    DeviceHistory,
+    history_capacity,
+    history_flags,
+)
+from .hub import HeatmiserNeoHub, HubUnavailableError
+from .models import (
+    Capability,
+    HubSummary,
+    NeoDevice,
+    NeoDeviceStore,
+    PendingWrites,
+    as_float,
+    device_capabilities,
+    device_entity_unique_id,
+    hub_summary,
+    same_value,
+)
+from .runtime import RuntimeCounters
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds an optimistic value is kept while the hub still reports the old one.
+PENDING_WRITE_TIMEOUT = 120
+
+# Polls a device must be missing from before its entities are removed, so
+# that one incomplete reply from the hub does not remove them.
+REMOVED_DEVICE_POLLS = 3
+
+# Hold times are reported in whole minutes, so an end time within a minute of
+# the stored one belongs to the same hold.
+HOLD_END_TOLERANCE = timedelta(minutes=1)
+# Delay after a hold ends before the refresh, so that the hub has cleared it.
+HOLD_EXPIRY_DELAY = timedelta(seconds=5)
+
+
+class _DeviceEntityDescription(Protocol):
+    """The parts of a device entity description used by the entity plan."""
+
+    key: str
+    capabilities: Capability
+    tier: EntityTier
+    setup_filter_fn: Callable[[NeoDevice, Any], bool]
+
+
+@dataclass
+class _PendingCommand:
+    """A hub command waiting to be sent for a group of devices."""
+
+    future: asyncio.Future
+    devices: list[NeoDevice] = field(default_factory=list)
+    actions: list[Callable[[], None]] = field(default_factory=list)
+    refresh: bool = False
+
 
 class HeatmiserNeoCoordinator(DataUpdateCoordinator[NeoHub]):
     """Coordinator Class for Heatmiser Neo Hub."""
 
     # _device_serial_numbers: dict[int, dict[str, str]]
 
-    def __init__(self, hass: HomeAssistant, hub: NeoHub) -> None:
+    def __init__(self, hass: HomeAssistant, hub: HeatmiserNeoHub) -> None:
         """Initialize the HeatmiserNeo Update Coordinator."""
         self.hub = hub
         super().__init__(
@@ -39,12 +105,42 @@ class HeatmiserNeoCoordinator(DataUpdateCoordinator[NeoHub]):
             update_interval=timedelta(seconds=30),
             always_update=True,
         )
+        self.runtime = RuntimeCounters(hass, self.config_entry.entry_id)
+        self.history: dict[str, DeviceHistory] = {}
+        self._pending_commands: dict[tuple, _PendingCommand] = {}
+        self._pending_writes = PendingWrites(PENDING_WRITE_TIMEOUT)
+        hub.breaker.set_listener(self.async_update_listeners)
+        self._device_listeners: list[Callable[[list[NeoDevice]], None]] = []
+        self._missing_devices: dict[str, tuple[NeoDevice, int]] = {}
+        self.capabilities: dict[str, Capability] = {}
+        # Keys of the entity descriptions planned for each device.
+        self._planned: dict[str, set[str]] = {}
+        self.summary = HubSummary()
+        # End time of the timed hold on each device.
+        self.hold_ends: dict[str, datetime] = {}
+        self._hold_refresh_at: datetime | None = None
+        self._cancel_hold_refresh: CALLBACK_TYPE | None = None
+        advanced_options = self.config_entry.options.get(CONF_DEFAULTS, {}).get(
+            CONF_ADVANCED_OPTIONS, {}
+        )
+        self._history_capacity = history_capacity(
+            HISTORY_RETENTION, self.update_interval.total_seconds()
+        )
+        tiers = list(EntityTier)
+        entity_tier = EntityTier(
+            advanced_options.get(CONF_ENTITY_TIER, DEFAULT_ENTITY_TIER)
+        )
+        # Entity tiers whose device entities are created.
+        self.entity_tiers = set(tiers[: tiers.index(entity_tier) + 1])
 
     async def _async_update_data(self):
         """Fetch data from the Hub all at once and make it available for all devices."""
         _LOGGER.info("Executing update_data()")
         async with asyncio.timeout(30):
-            all_live_data = await self.hub.get_all_live_data()
+            try:
+                all_live_data = await self.hub.get_all_live_data()
+            except HubUnavailableError as err:
+                raise UpdateFailed(str(err)) from err
 
             if not all_live_data[ATTR_SYSTEM]:
                 ## System data is very important. If it is not returned by the API
@@ -53,9 +149,348 @@ class HeatmiserNeoCoordinator(DataUpdateCoordinator[NeoHub]):
 
             _LOGGER.debug("live_data: %s", all_live_data)
 
-            devices = {device.name: device for device in all_live_data[ATTR_DEVICES]}
+            # Keep compact snapshots rather than the NeoStats, which carry the
+            # full raw payload and a reference to the hub.
+            previous = self.data[0] if self.data else None
+            devices = NeoDeviceStore.from_neostats(
+                all_live_data.pop(ATTR_DEVICES), previous
+            )
+            added: list[NeoDevice] = []
+            removed: list[NeoDevice] = []
+            if previous is not None:
+                added, removed = self._track_device_changes(previous, devices)
+            changed = self._update_capabilities(devices, all_live_data[ATTR_SYSTEM])
+            if added or changed or removed:
+                # Run once the new data has been stored on the coordinator.
+                self.hass.loop.call_soon(
+                    self._async_devices_changed, added, changed, removed
+                )
+            self._pending_writes.overlay(devices)
+            self.summary = hub_summary(devices, self.capabilities)
+            now = time.time()
+            self.runtime.update(devices.values(), now)
+            self._record_history(devices, now)
             return devices, all_live_data
 
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled hold expiry refresh."""
+        await super().async_shutdown()
+        self._schedule_hold_refresh(None)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the hold end times, then the listeners.
+
+        Called after every refresh and every command, so holds are picked up
+        whether they were set from Home Assistant or observed on the hub.
+        """
+        if self.data:
+            self._update_hold_ends(self.data[0])
+        super().async_update_listeners()
+
+    def _update_hold_ends(self, devices: NeoDeviceStore) -> None:
+        """Store the end time of each timed hold.
+
+        Only the remaining time is reported, so the end time is worked out
+        when a hold is first seen and kept while later reports agree with it.
+        """
+        now = dt_util.utcnow()
+        hold_ends = {}
+        for name, device in devices.items():
+            if not device.hold_on or not device.hold_time:
+                continue
+            end = now + device.hold_time
+            previous = self.hold_ends.get(name)
+            if previous is not None and abs(end - previous) < HOLD_END_TOLERANCE:
+                end = previous
+            hold_ends[name] = end
+        self.hold_ends = hold_ends
+        self._schedule_hold_refresh(
+            min((end for end in hold_ends.values() if end > now), default=None)
+        )
+
+    def _schedule_hold_refresh(self, when: datetime | None) -> None:
+        """Schedule one refresh when the next hold ends, replacing any other."""
+        if when == self._hold_refresh_at:
+            return
+        if self._cancel_hold_refresh:
+            self._cancel_hold_refresh()
+            self._cancel_hold_refresh = None
+        self._hold_refresh_at = when
+        if when is not None:
+            self._cancel_hold_refresh = async_track_point_in_utc_time(
+                self.hass, self._async_hold_expired, when + HOLD_EXPIRY_DELAY
+            )
+
+    @callback
+    def _async_hold_expired(self, _now: datetime) -> None:
+        """Refresh when a hold ends, instead of waiting for the next poll."""
+        self._cancel_hold_refresh = None
+        self._hold_refresh_at = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def entity_plan[_D: _DeviceEntityDescription](
+        self, descriptions: Iterable[_D], devices: Iterable[NeoDevice]
+    ) -> list[tuple[NeoDevice, _D]]:
+        """Return the device and description pairs to create entities for.
+
+        Device capabilities are worked out on each update, so matching a
+        description against a device is a single bitmask test. Descriptions
+        outside the configured entity tier are skipped, and so are those
+        already planned for a device, so that the plan can be run again for
+        a device whose capabilities changed.
+        """
+        system_data = self.system_data
+        descriptions = list(descriptions)
+        devices = list(devices)
+        self._remove_untiered_entities(
+            {
+                device_entity_unique_id(device, self.serial_number, description.key)
+                for description in descriptions
+                if description.tier not in self.entity_tiers
+                for device in devices
+            }
+        )
+        plan = [
+            (device, description)
+            for description in descriptions
+            if description.tier in self.entity_tiers
+            for device in devices
+            if description.key not in self._planned.get(device.name, ())
+            and self.capabilities[device.name] & description.capabilities
+            == description.capabilities
+            and description.setup_filter_fn(device, system_data)
+        ]
+        for device, description in plan:
+            self._planned.setdefault(device.name, set()).add(description.key)
+        return plan
+
+    def _remove_untiered_entities(self, unique_ids: set[str]) -> None:
+        """Remove registered entities outside the configured entity tier.
+
+        They were created with a larger tier, and would otherwise be left in
+        the registry as unavailable entities.
+        """
+        if not unique_ids:
+            return
+        registry = er.async_get(self.hass)
+        for entry in er.async_entries_for_config_entry(
+            registry, self.config_entry.entry_id
+        ):
+            if entry.unique_id in unique_ids:
+                _LOGGER.info(
+                    "Removing %s, outside the configured entity tier", entry.entity_id
+                )
+                registry.async_remove(entry.entity_id)
+
+    def entity_still_planned(
+        self, device: NeoDevice, description: _DeviceEntityDescription
+    ) -> bool:
+        """Return whether a device still has the capabilities for an entity.
+
+        If not, the entity is forgotten so that it can be planned again
+        should the device regain them.
+        """
+        capabilities = self.capabilities.get(device.name)
+        if (
+            capabilities is None
+            or capabilities & description.capabilities == description.capabilities
+        ):
+            return True
+        self._planned.get(device.name, set()).discard(description.key)
+        return False
+
+    def _update_capabilities(
+        self, devices: NeoDeviceStore, system_data: Any
+    ) -> list[NeoDevice]:
+        """Work out the capabilities of each device.
+
+        Return the devices already known whose capabilities changed, e.g. a
+        thermostat switched to time clock mode or a floor probe fitted.
+        """
+        changed = []
+        for name, device in devices.items():
+            capabilities = device_capabilities(device, system_data)
+            previous = self.capabilities.get(name)
+            self.capabilities[name] = capabilities
+            if previous is not None and capabilities != previous:
+                _LOGGER.info(
+                    "Capabilities of %s changed from %s to %s",
+                    name,
+                    previous,
+                    capabilities,
+                )
+                changed.append(device)
+        return changed
+
+    @callback
+    def async_add_device_listener(
+        self, listener: Callable[[list[NeoDevice]], None]
+    ) -> CALLBACK_TYPE:
+        """Call listener with the devices that join the hub or change after setup."""
+        self._device_listeners.append(listener)
+        return lambda: self._device_listeners.remove(listener)
+
+    def _track_device_changes(
+        self, previous: NeoDeviceStore, devices: NeoDeviceStore
+    ) -> tuple[list[NeoDevice], list[NeoDevice]]:
+        """Find the devices that joined or left the hub since the last poll."""
+        added = []
+        for name, device in devices.items():
+            if name not in previous and self._missing_devices.pop(name, None) is None:
+                added.append(device)
+        for name, device in previous.items():
+            if name not in devices:
+                self._missing_devices[name] = (device, 0)
+
+        removed = []
+        for name, (device, polls) in list(self._missing_devices.items()):
+            if polls + 1 >= REMOVED_DEVICE_POLLS:
+                del self._missing_devices[name]
+                removed.append(device)
+            else:
+                self._missing_devices[name] = (device, polls + 1)
+
+        return added, removed
+
+    @callback
+    def _async_devices_changed(
+        self,
+        added: list[NeoDevice],
+        changed: list[NeoDevice],
+        removed: list[NeoDevice],
+    ) -> None:
+        """Add entities for new or changed devices and remove departed devices.
+
+        Entities a changed device no longer supports remove themselves on
+        the next update (see entity_still_planned).
+        """
+        if added:
+            _LOGGER.info("New devices: %s", ", ".join(d.name for d in added))
+        if added or changed:
+            for listener in list(self._device_listeners):
+                listener(added + changed)
+
+        registry = dr.async_get(self.hass)
+        for device in removed:
+            _LOGGER.info("Removing device %s, no longer on the hub", device.name)
+            self.history.pop(device.name, None)
+            self.runtime.remove_device(device.name)
+            self.capabilities.pop(device.name, None)
+            self._planned.pop(device.name, None)
+            entry = registry.async_get_device(
+                identifiers={(DOMAIN, f"{self.serial_number}_{device.serial_number}")}
+            )
+            if entry:
+                # Removing the device also removes its entities.
+                registry.async_update_device(
+                    entry.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    def _record_history(self, devices: NeoDeviceStore, now: float) -> None:
+        """Append the state of each online device to its history."""
+        for name, device in devices.items():
+            if device.offline:
+                continue
+            history = self.history.get(name)
+            if history is None:
+                history = self.history[name] = DeviceHistory(self._history_capacity)
+            history.append(
+                now,
+                as_float(device.temperature),
+                as_float(device.target_temperature),
+                history_flags(device),
+            )
+
+    async def async_device_command(
+        self,
+        command: str,
+        *args: Any,
+        device: NeoDevice,
+        optimistic: Callable[[], None] | None = None,
+        refresh: bool = False,
+    ) -> Any:
+        """Send a hub command for a device, grouped with identical calls.
+
+        Entity services run concurrently for every targeted entity. Calls made
+        in the same event loop iteration with the same command and arguments
+        are sent as one hub command for all their devices. Once it succeeds
+        the optimistic updates are applied together, listeners are notified
+        once and, if any caller asked for it, a single refresh is requested.
+        """
+        key = (command, args)
+        pending = self._pending_commands.get(key)
+        if pending is None:
+            pending = _PendingCommand(self.hass.loop.create_future())
+            self._pending_commands[key] = pending
+            self.hass.loop.call_soon(
+                self.hass.async_create_task, self._async_send_command(key)
+            )
+        pending.devices.append(device)
+        if optimistic:
+            pending.actions.append(optimistic)
+        pending.refresh |= refresh
+        return await pending.future
+
+    async def _async_send_command(self, key: tuple) -> None:
+        """Send a grouped hub command and resolve its callers."""
+        pending = self._pending_commands.pop(key)
+        command, args = key
+        try:
+            result = await getattr(self.hub, command)(*args, pending.devices)
+        except Exception as err:  # noqa: BLE001
+            if not pending.future.done():
+                pending.future.set_exception(err)
+            return
+
+        # Optimistically update the state so that the UI feels snappy.
+        # The values will be confirmed next time we get new data. The command
+        # has been sent, so a failing update must not fail the callers.
+        try:
+            for action in pending.actions:
+                try:
+                    action()
+                except Exception:
+                    _LOGGER.exception("Failed to apply optimistic %s update", command)
+            self.async_update_listeners()
+        except Exception:
+            _LOGGER.exception("Failed to update listeners after %s", command)
+        finally:
+            if not pending.future.done():
+                pending.future.set_result(result)
+        if pending.refresh:
+            await self.async_request_refresh()
+
+    async def async_refresh_profiles(self, timer: bool = False) -> None:
+        """Fetch only the heating or timer profiles and merge them into the data.
+
+        Used after profiles are created, renamed or deleted, instead of a full
+        refresh of the live data.
+        """
+        if timer:
+            key = ATTR_TIMER_PROFILES
+            result = await self.hub.get_timer_profiles()
+        else:
+            key = ATTR_PROFILES
+            result = await self.hub.get_profiles()
+        profiles = {
+            getattr(profile, "PROFILE_ID", None): profile
+            for profile in vars(result).values()
+        }
+
+        _, all_data = self.data
+        # The key is present but None until the hub data has been fetched.
+        current = all_data[key] = all_data.get(key) or {}
+        for profile_id in current.keys() - profiles.keys():
+            del current[profile_id]
+        current.update(profiles)
+        self.async_update_listeners()
+
+    async def async_get_zone_groups(self) -> dict[str, list[str]]:
+        """Get the zone groups defined on the hub, with their zone names."""
+        response = await self.hub._send({"GET_GROUPS": 0})  # noqa: SLF001
+        return {name: list(zones) for name, zones in vars(response).items()}
+
     def _get_device_sn(self, device_id: int) -> str:
         """Get a device serial number by its device id."""
 
@@ -64,13 +499,39 @@ class HeatmiserNeoCoordinator(DataUpdateCoordinator[NeoHub]):
         )
 
     def update_in_memory_state(
-        self, action: Callable[[NeoStat], None], filter: Callable[[NeoStat], bool]
+        self, action: Callable[[NeoDevice], None], filter: Callable[[NeoDevice], bool]
     ) -> None:
-        """Call action on devices matching filter."""
+        """Call action on devices matching filter, keeping the changes pending."""
         devices, _ = self.data
         for device in devices.values():
             if filter(device):
+                before = device.as_dict()
                 action(device)
+                for name, value in device.as_dict().items():
+                    if value != before[name]:
+                        self._pending_writes.add(device, name, value)
+
+    def set_optimistic(self, device: NeoDevice, **fields: Any) -> None:
+        """Update device fields after a write, until the hub reports them too.
+
+        Without this, a poll made before the hub has applied a command would
+        revert the fields to their old values for one update.
+        """
+        for name, value in fields.items():
+            setattr(device, name, value)
+            self._pending_writes.add(device, name, value)
+
+    def already_set(self, target: Any, **fields: Any) -> bool:
+        """Return whether a device or the hub already holds the values.
+
+        Device snapshots include pending optimistic writes, so a value that
+        was just written but not reported yet also counts as set. Setters
+        use this to skip hub commands that would not change anything.
+        """
+        return all(
+            same_value(getattr(target, name, None), value)
+            for name, value in fields.items()
+        )
 
     @property
     def live_data(self):
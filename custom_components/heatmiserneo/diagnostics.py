@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_HOST
@@ -14,11 +14,12 @@ from homeassistant.core import HomeAssistant
 
 from . import HeatmiserNeoConfigEntry
 from .helpers import to_dict
+from .models import NeoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 TO_REDACT_CONFIG = {CONF_HOST, "title", "unique_id", "token"}
-TO_REDACT_RAW_DATA = {"PIN_NUMBER"}
+TO_REDACT_RAW_DATA = {"PIN_NUMBER", "SERIAL_NUMBER"}
 TO_REDACT_DEVICES = {"pin_number"}
 
 
@@ -47,9 +48,9 @@ async def async_get_config_entry_diagnostics(
     devices_sns = {device.serial_number for device in neo_devices.values()}
     devices_sns = {n: "REDACTED-SN-" + str(i) for i, n in enumerate(devices_sns)}
     zones = {
-        device._data_.ZONE_NAME
+        device.zone_name
         for device in neo_devices.values()
-        if hasattr(device._data_, "ZONE_NAME")
+        if device.zone_name is not None
     }
     device_list = {z: await retrieve_zone_device_list(z, hub) for z in zones}
     return {
@@ -71,21 +72,16 @@ async def async_get_config_entry_diagnostics(
     }
 
 
-def convert_to_dict(device: NeoStat, device_sns: dict[str, str]) -> dict:
-    """Convert a NeoStat entity to a redacted dict."""
+def convert_to_dict(device: NeoDevice, device_sns: dict[str, str]) -> dict:
+    """Convert a device snapshot to a redacted dict.
 
-    dev_diagnostics = device.__dict__.copy()
-    dev_diagnostics["raw_data"] = async_redact_data(
-        dict(vars(device._data_)), TO_REDACT_RAW_DATA
-    )
-    del dev_diagnostics["_hub"]
-    del dev_diagnostics["_data_"]
+    The raw hub data for each device is included in raw_live_data.
+    """
+
+    dev_diagnostics = device.as_dict()
     dev_diagnostics["serial_number"] = device_sns.get(
         dev_diagnostics.get("serial_number", ""), "REDACTED-SN-UNKNOWN"
     )
-    dev_diagnostics["raw_data"]["SERIAL_NUMBER"] = device_sns.get(
-        dev_diagnostics["raw_data"].get("SERIAL_NUMBER", ""), "REDACTED-SN-UNKNOWN"
-    )
     return async_redact_data(dict(dev_diagnostics), TO_REDACT_DEVICES)
 
 
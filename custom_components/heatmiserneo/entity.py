@@ -9,14 +9,15 @@ from functools import partial
 import logging
 from typing import Any
 
-from neohubapi.neohub import ATTR_SYSTEM, NeoHub, NeoStat, ScheduleFormat
+from neohubapi.neohub import ATTR_SYSTEM, NeoHub, ScheduleFormat
 from propcache import cached_property
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import ServiceCall
+from homeassistant.core import ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -24,21 +25,30 @@ from .const import (
     HEATMISER_HUB_PRODUCT_LIST,
     HEATMISER_PRODUCT_LIST,
     HEATMISER_TYPE_IDS_AWAY,
+    EntityTier,
 )
 from .coordinator import HeatmiserNeoCoordinator
 from .helpers import set_away, set_holiday
+from .models import Capability, NeoDevice, device_entity_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
+NO_CAPABILITIES = Capability(0)
+
 
 @dataclass(frozen=True, kw_only=True)
 class HeatmiserNeoEntityDescription(EntityDescription):
     """Describes Heatmiser Neo entity."""
 
-    setup_filter_fn: Callable[[NeoStat, Any], bool] = lambda dev, sys_data: True
-    availability_fn: Callable[[NeoStat], bool] = lambda device: not device.offline
+    # Capabilities a device needs to get the entity.
+    capabilities: Capability = NO_CAPABILITIES
+    # Smallest entity tier the entity is created in, if not the one given by
+    # its category and whether it is enabled by default (see tier).
+    entity_tier: EntityTier | None = None
+    setup_filter_fn: Callable[[NeoDevice, Any], bool] = lambda dev, sys_data: True
+    availability_fn: Callable[[NeoDevice], bool] = lambda device: not device.offline
     enabled_by_default_fn: Callable[[HeatmiserNeoEntity], bool] | None = None
-    icon_fn: Callable[[NeoStat], str | None] | None = None
+    icon_fn: Callable[[NeoDevice], str | None] | None = None
     # extra_attrs: list[str] | None = None
     custom_functions: (
         dict[
@@ -48,6 +58,17 @@ class HeatmiserNeoEntityDescription(EntityDescription):
         | None
     ) = None
 
+    @property
+    def tier(self) -> EntityTier:
+        """Return the smallest entity tier the entity is created in."""
+        if self.entity_tier is not None:
+            return self.entity_tier
+        if not self.entity_registry_enabled_default:
+            return EntityTier.FULL
+        if self.entity_category is not None or self.enabled_by_default_fn:
+            return EntityTier.EXTENDED
+        return EntityTier.CORE
+
 
 @dataclass(frozen=True, kw_only=True)
 class HeatmiserNeoHubEntityDescription(EntityDescription):
@@ -57,7 +78,7 @@ class HeatmiserNeoHubEntityDescription(EntityDescription):
         lambda coordinator: True
     )
     enabled_by_default_fn: Callable[[HeatmiserNeoHubEntity], bool] | None = None
-    icon_fn: Callable[[NeoStat], str | None] | None = None
+    icon_fn: Callable[[NeoDevice], str | None] | None = None
     # extra_attrs: list[str] | None = None
     custom_functions: (
         dict[
@@ -76,7 +97,7 @@ class HeatmiserNeoEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
 
     def __init__(
         self,
-        neodevice: NeoStat,
+        neodevice: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoEntityDescription,
@@ -94,9 +115,29 @@ class HeatmiserNeoEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
         self._neodevice = neodevice
         self._hub = hub
         self.entity_description = entity_description
+        # The identity of the device does not change, so the unique id and
+        # device info are built once. Only the firmware version is updated.
+        self._attr_unique_id = device_entity_unique_id(
+            neodevice, coordinator.serial_number, self._key
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={
+                (
+                    DOMAIN,
+                    f"{coordinator.serial_number}_{neodevice.serial_number}",
+                )
+            },
+            name=neodevice.name,
+            manufacturer="Heatmiser",
+            model=f"{HEATMISER_PRODUCT_LIST[neodevice.device_type]}",
+            suggested_area=neodevice.name,
+            serial_number=neodevice.serial_number,
+            sw_version=neodevice.stat_version,
+            via_device=(DOMAIN, coordinator.serial_number),
+        )
 
     @property
-    def data(self) -> NeoStat | None:
+    def data(self) -> NeoDevice | None:
         """Helper to get the data for the current device."""
         (neo_devices, _) = self.coordinator.data
         return neo_devices.get(self._neodevice.name, None)
@@ -114,30 +155,6 @@ class HeatmiserNeoEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
             return self.entity_description.availability_fn(self.data)
         return False
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID for this entity."""
-        return f"{self._neodevice.name}_{self.coordinator.serial_number}_{self._neodevice.serial_number}_{self._key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this Heatmiser Neo instance."""
-        return DeviceInfo(
-            identifiers={
-                (
-                    DOMAIN,
-                    f"{self.coordinator.serial_number}_{self._neodevice.serial_number}",
-                )
-            },
-            name=self._neodevice.name,
-            manufacturer="Heatmiser",
-            model=f"{HEATMISER_PRODUCT_LIST[self.data.device_type]}",
-            suggested_area=self._neodevice.name,
-            serial_number=self._neodevice.serial_number,
-            sw_version=self.data.stat_version,
-            via_device=(DOMAIN, self.coordinator.serial_number),
-        )
-
     @property
     def extra_state_attributes(self):
         """Return the additional state attributes."""
@@ -169,6 +186,26 @@ class HeatmiserNeoEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
             return self.entity_description.enabled_by_default_fn(self)
         return super().entity_registry_enabled_default
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the firmware version if it has changed, then write the state.
+
+        An entity the device no longer has the capabilities for, e.g. after
+        switching to time clock mode, removes itself instead.
+        """
+        data = self.data
+        if data and not self.coordinator.entity_still_planned(
+            data, self.entity_description
+        ):
+            _LOGGER.info(
+                "Removing %s, no longer supported by the device", self.entity_id
+            )
+            er.async_get(self.hass).async_remove(self.entity_id)
+            return
+        if data and data.stat_version != self._attr_device_info.get("sw_version"):
+            _async_update_sw_version(self, data.stat_version)
+        self.async_write_ha_state()
+
     async def call_custom_action(self, service_call: ServiceCall) -> Any | None:
         """Call a custom action specified in the entity description."""
         result = await self.entity_description.custom_functions.get(
@@ -227,34 +264,26 @@ class HeatmiserNeoHubEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
         self._key = entity_description.key
         self._hub = hub
         self.entity_description = entity_description
-
-    @property
-    def available(self):
-        """Returns whether the entity is available or not."""
-        return True
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID for this entity."""
-        return f"{self.coordinator.serial_number}_{self._key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this Heatmiser Neo instance."""
-        return DeviceInfo(
+        self._attr_unique_id = f"{coordinator.serial_number}_{self._key}"
+        self._attr_device_info = DeviceInfo(
             identifiers={
                 (
                     DOMAIN,
-                    f"{self.coordinator.serial_number}",
+                    f"{coordinator.serial_number}",
                 )
             },
-            name=f"NeoHub - {self._hub._host}",  # noqa: SLF001
+            name=f"NeoHub - {hub._host}",  # noqa: SLF001
             manufacturer="Heatmiser",
-            model=f"{HEATMISER_HUB_PRODUCT_LIST[self.coordinator.system_data.HUB_TYPE]}",
-            serial_number=self.coordinator.serial_number,
-            sw_version=self.coordinator.system_data.HUB_VERSION,
+            model=f"{HEATMISER_HUB_PRODUCT_LIST[coordinator.system_data.HUB_TYPE]}",
+            serial_number=coordinator.serial_number,
+            sw_version=coordinator.system_data.HUB_VERSION,
         )
 
+    @property
+    def available(self):
+        """Returns whether the entity is available or not."""
+        return True
+
     @property
     def should_poll(self) -> bool:
         """Don't poll - we fetch the data from the hub all at once."""
@@ -277,6 +306,14 @@ class HeatmiserNeoHubEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
             return self.entity_description.enabled_by_default_fn(self)
         return super().entity_registry_enabled_default
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the firmware version if it has changed, then write the state."""
+        sw_version = self.coordinator.system_data.HUB_VERSION
+        if sw_version != self._attr_device_info.get("sw_version"):
+            _async_update_sw_version(self, sw_version)
+        self.async_write_ha_state()
+
     async def call_custom_action(self, service_call: ServiceCall) -> Any | None:
         """Call a custom action specified in the entity description."""
         result = await self.entity_description.custom_functions.get(
@@ -286,6 +323,16 @@ class HeatmiserNeoHubEntity(CoordinatorEntity[HeatmiserNeoCoordinator]):
         return result
 
 
+@callback
+def _async_update_sw_version(entity: Entity, sw_version: Any) -> None:
+    """Record a firmware update in the cached and the registered device info."""
+    entity._attr_device_info["sw_version"] = sw_version  # noqa: SLF001
+    if entity.device_entry:
+        dr.async_get(entity.hass).async_update_device(
+            entity.device_entry.id, sw_version=sw_version
+        )
+
+
 async def call_custom_action(
     entity: HeatmiserNeoEntity, service_call: ServiceCall
 ) -> Any | None:
@@ -303,7 +350,7 @@ async def call_custom_action(
     return await entity.call_custom_action(service_call)
 
 
-def _device_supports_away(dev: NeoStat) -> bool:
+def _device_supports_away(dev: NeoDevice) -> bool:
     return dev.device_type in HEATMISER_TYPE_IDS_AWAY
 
 
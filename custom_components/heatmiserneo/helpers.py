@@ -2,19 +2,19 @@
 """Constants used by multiple Heatmiser Neo modules."""
 
 from neohubapi.enums import ScheduleFormat, Weekday
-from neohubapi.neohub import NeoStat
 
 from .coordinator import HeatmiserNeoCoordinator
+from .models import NeoDevice
 
 
-def set_away(state: bool, dev: NeoStat) -> None:
+def set_away(state: bool, dev: NeoDevice) -> None:
     """Set away flag on device."""
     dev.away = state
     if state:
-        dev.target_temperature = dev._data_.FROST_TEMP
+        dev.target_temperature = dev.frost_temp
 
 
-def set_holiday(state: bool, dev: NeoStat) -> None:
+def set_holiday(state: bool, dev: NeoDevice) -> None:
     """Cancel holiday on device."""
     dev.holiday = state
 
@@ -152,11 +152,14 @@ def _next_level(time: str, levels):
 
 
 def profile_level(
-    profile_id, data: NeoStat, coordinator: HeatmiserNeoCoordinator, next: bool = False
+    profile_id,
+    data: NeoDevice,
+    coordinator: HeatmiserNeoCoordinator,
+    next: bool = False,
 ) -> str | None:
     """Convert a profile id to a name."""
     profile_format = coordinator.system_data.FORMAT
-    device_time = data._data_.TIME
+    device_time = data.device_time
     device_weekday = data.weekday
     if len(device_time) == 4:
         device_time = f"0{device_time}"
@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
+"""Bounded in-memory history of device state for trend sensors."""
+
+from __future__ import annotations
+
+from array import array
+import enum
+import math
+
+from .models import NeoDevice
+
+# Windows, in seconds, of the trend sensors.
+DUTY_CYCLE_SHORT_WINDOW = 3600
+DUTY_CYCLE_LONG_WINDOW = 86400
+RATE_OF_CHANGE_WINDOW = 1800
+
+# Seconds of history kept: enough for the longest window and no more.
+HISTORY_RETENTION = max(
+    DUTY_CYCLE_SHORT_WINDOW, DUTY_CYCLE_LONG_WINDOW, RATE_OF_CHANGE_WINDOW
+)
+
+
+class HistoryFlag(enum.IntFlag):
+    """Boolean device states recorded with each history sample."""
+
+    HEAT_ON = 1
+    COOL_ON = 2
+    PREHEAT = 4
+    HOLD = 8
+
+
+class DeviceHistory:
+    """Fixed-size ring buffer of samples for one device.
+
+    Each sample holds a timestamp, the current and target temperature, a set
+    of HistoryFlag bits and the cumulative number of seconds spent heating
+    since the first sample. Windowed statistics only need the samples at the
+    start and end of the window, and window start cursors only move forward,
+    so queries are amortised O(1) and memory is fixed by the capacity.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_flags",
+        "_heating",
+        "_next_seq",
+        "_targets",
+        "_temperatures",
+        "_timestamps",
+        "_windows",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty history able to hold capacity samples."""
+        self._capacity = max(capacity, 2)
+        self._timestamps = array("d", bytes(8 * self._capacity))
+        self._temperatures = array("d", bytes(8 * self._capacity))
+        self._targets = array("d", bytes(8 * self._capacity))
+        self._heating = array("d", bytes(8 * self._capacity))
+        self._flags = array("B", bytes(self._capacity))
+        self._next_seq = 0
+        # Sequence number of the oldest sample inside each queried window.
+        self._windows: dict[float, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._next_seq, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of samples held."""
+        return self._capacity
+
+    @property
+    def _oldest_seq(self) -> int:
+        return max(0, self._next_seq - self._capacity)
+
+    def append(
+        self, timestamp: float, temperature: float, target: float, flags: HistoryFlag
+    ) -> None:
+        """Record a sample. Samples older than the last one are ignored."""
+        heating = 0.0
+        if self._next_seq:
+            last = (self._next_seq - 1) % self._capacity
+            elapsed = timestamp - self._timestamps[last]
+            if elapsed <= 0:
+                return
+            heating = self._heating[last]
+            if self._flags[last] & HistoryFlag.HEAT_ON:
+                heating += elapsed
+        index = self._next_seq % self._capacity
+        self._timestamps[index] = timestamp
+        self._temperatures[index] = temperature
+        self._targets[index] = target
+        self._heating[index] = heating
+        self._flags[index] = flags
+        self._next_seq += 1
+
+    def _window_start(self, seconds: float) -> int | None:
+        """Return the index of the oldest sample within seconds of the latest."""
+        if self._next_seq == 0:
+            return None
+        latest = self._next_seq - 1
+        cutoff = self._timestamps[latest % self._capacity] - seconds
+        seq = max(self._windows.get(seconds, 0), self._oldest_seq)
+        while seq < latest and self._timestamps[seq % self._capacity] < cutoff:
+            seq += 1
+        self._windows[seconds] = seq
+        return seq % self._capacity
+
+    def duty_cycle(self, seconds: float) -> float | None:
+        """Return the percentage of the window spent heating.
+
+        None is returned until at least half of the window has been recorded.
+        """
+        start = self._window_start(seconds)
+        if start is None:
+            return None
+        latest = (self._next_seq - 1) % self._capacity
+        elapsed = self._timestamps[latest] - self._timestamps[start]
+        if elapsed < seconds / 2:
+            return None
+        heating = self._heating[latest] - self._heating[start]
+        return round(100 * heating / elapsed, 1)
+
+    def rate_of_change(self, seconds: float) -> float | None:
+        """Return the temperature change per hour over the window."""
+        start = self._window_start(seconds)
+        if start is None:
+            return None
+        latest = (self._next_seq - 1) % self._capacity
+        elapsed = self._timestamps[latest] - self._timestamps[start]
+        if elapsed < seconds / 2:
+            return None
+        change = self._temperatures[latest] - self._temperatures[start]
+        if math.isnan(change):
+            return None
+        return round(change * 3600 / elapsed, 2)
+
+    def time_to_setpoint(self, seconds: float) -> float | None:
+        """Return the estimated minutes until the target temperature is reached.
+
+        The estimate uses the rate of change over the window and is only
+        available while the device is heating towards its target.
+        """
+        if self._next_seq == 0:
+            return None
+        latest = (self._next_seq - 1) % self._capacity
+        remaining = self._targets[latest] - self._temperatures[latest]
+        if math.isnan(remaining):
+            return None
+        if remaining <= 0:
+            return 0
+        if not self._flags[latest] & HistoryFlag.HEAT_ON:
+            return None
+        rate = self.rate_of_change(seconds)
+        if not rate or rate <= 0:
+            return None
+        return round(remaining * 60 / rate)
+
+
+def history_capacity(retention_seconds: float, interval_seconds: float) -> int:
+    """Return the number of samples needed to cover the retention period."""
+    return math.ceil(retention_seconds / interval_seconds) + 1
+
+
+def history_flags(device: NeoDevice) -> HistoryFlag:
+    """Return the HistoryFlag bits for the current state of a device."""
+    flags = HistoryFlag(0)
+    if device.heat_on:
+        flags |= HistoryFlag.HEAT_ON
+    if device.cool_on:
+        flags |= HistoryFlag.COOL_ON
+    if device.preheat_active:
+        flags |= HistoryFlag.PREHEAT
+    if device.hold_on:
+        flags |= HistoryFlag.HOLD
+    return flags
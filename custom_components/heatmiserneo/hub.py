@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
+"""Shared NeoHub clients for the HeatmiserNeo integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+import logging
+import random
+import time
+from typing import Any
+
+from neohubapi.neohub import NeoHub, NeoHubConnectionError
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for a reply. Shorter than the neohubapi default so that a
+# request fails before the coordinator gives up on the poll.
+REQUEST_TIMEOUT = 20
+
+# Consecutive failed requests that open the circuit.
+FAILURE_THRESHOLD = 3
+# Seconds before the first probe of an unreachable hub, doubled after each
+# failed probe up to the maximum.
+BACKOFF_BASE = 30
+BACKOFF_MAX = 300
+
+# Seconds an unused client stays connected, so that the entry setup after a
+# config flow or a reload can reuse its connection and cached hub data. Clients
+# are disconnected straight away when Home Assistant stops or their entry is
+# removed.
+IDLE_DISCONNECT_DELAY = 60
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class HubUnavailableError(NeoHubConnectionError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop sending requests to a hub that keeps failing.
+
+    After FAILURE_THRESHOLD consecutive failures the circuit opens and
+    requests fail immediately. Once the backoff delay has passed, the next
+    request is let through as a probe (half-open): if it succeeds the circuit
+    closes, otherwise it opens again with a longer, jittered delay.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a closed circuit."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.retry_at: float | None = None
+        self._opened = 0
+        self._on_change: Callable[[], None] | None = None
+
+    def set_listener(self, on_change: Callable[[], None] | None) -> None:
+        """Set the function called when the state changes."""
+        self._on_change = on_change
+
+    def before_request(self) -> None:
+        """Raise HubUnavailableError if a request should not be sent."""
+        if self.state is CircuitState.CLOSED:
+            return
+        if self.state is CircuitState.OPEN and time.monotonic() >= self.retry_at:
+            self._set_state(CircuitState.HALF_OPEN)
+            return
+        raise HubUnavailableError(
+            f"Hub is unreachable, next attempt in {self.retry_in:.0f}s"
+        )
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.failures = 0
+        self._opened = 0
+        self.retry_at = None
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= FAILURE_THRESHOLD:
+            delay = min(BACKOFF_BASE * 2**self._opened, BACKOFF_MAX)
+            delay += random.uniform(0, delay / 2)
+            self._opened += 1
+            self.retry_at = time.monotonic() + delay
+            _LOGGER.warning(
+                "Hub failed %s consecutive requests, retrying in %.0fs",
+                self.failures,
+                delay,
+            )
+            self._set_state(CircuitState.OPEN)
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe, or 0 if not open."""
+        if self.retry_at is None:
+            return 0
+        return max(self.retry_at - time.monotonic(), 0)
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state is self.state:
+            return
+        _LOGGER.debug("Hub circuit %s -> %s", self.state, state)
+        self.state = state
+        if self._on_change:
+            self._on_change()
+
+
+class HeatmiserNeoHub(NeoHub):
+    """NeoHub client that stops calling a hub that is not responding."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client."""
+        kwargs.setdefault("request_timeout", REQUEST_TIMEOUT)
+        super().__init__(*args, **kwargs)
+        self.breaker = CircuitBreaker()
+
+    async def _send(self, message, expected_reply=None):
+        """Send a message unless the circuit is open."""
+        self.breaker.before_request()
+        try:
+            reply = await super()._send(message, expected_reply)
+        except (NeoHubConnectionError, OSError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            # A probe that did not complete must not leave the circuit half-open.
+            if self.breaker.state is CircuitState.HALF_OPEN:
+                self.breaker.record_failure()
+            raise
+        # Commands with an expected reply return False instead of raising;
+        # the connection is closed only if the failure was a connection one.
+        if reply is False and (self._client is None or not self._client.running):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return reply
+
+
+@dataclass
+class _SharedHub:
+    """A hub client and the number of config entries and flows using it."""
+
+    hub: HeatmiserNeoHub
+    users: int = 0
+    disconnect: asyncio.TimerHandle | None = None
+
+
+DATA_HUBS: HassKey[dict[tuple[str, int, str | None], _SharedHub]] = HassKey(
+    f"{DOMAIN}_hubs"
+)
+
+
+@callback
+def async_get_hub(
+    hass: HomeAssistant, host: str, port: int, token: str | None = None
+) -> HeatmiserNeoHub:
+    """Return the shared client for a hub, creating it if needed.
+
+    Each call must be paired with a call to async_release_hub.
+    """
+    hubs = hass.data.get(DATA_HUBS)
+    if hubs is None:
+        hubs = hass.data[DATA_HUBS] = {}
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, partial(_async_disconnect_all, hass)
+        )
+    key = (host, port, token)
+    shared = hubs.get(key)
+    if shared is None:
+        shared = hubs[key] = _SharedHub(HeatmiserNeoHub(host, port, token=token))
+    if shared.disconnect:
+        shared.disconnect.cancel()
+        shared.disconnect = None
+    shared.users += 1
+    return shared.hub
+
+
+@callback
+def async_release_hub(hass: HomeAssistant, hub: HeatmiserNeoHub) -> None:
+    """Stop using a shared client, disconnecting it once it has been idle."""
+    hubs = hass.data.get(DATA_HUBS, {})
+    key = next((key for key, shared in hubs.items() if shared.hub is hub), None)
+    if key is None:
+        return
+    shared = hubs[key]
+    shared.users -= 1
+    if shared.users > 0:
+        return
+    hub.breaker.set_listener(None)
+    if hass.is_stopping:
+        hass.async_create_task(_async_disconnect_idle(hass, key))
+        return
+    shared.disconnect = hass.loop.call_later(
+        IDLE_DISCONNECT_DELAY,
+        lambda: hass.async_create_task(_async_disconnect_idle(hass, key)),
+    )
+
+
+async def async_disconnect_unused_hub(
+    hass: HomeAssistant, host: str, port: int, token: str | None = None
+) -> None:
+    """Disconnect a shared client now if nothing uses it any more."""
+    key = (host, port, token)
+    shared = hass.data.get(DATA_HUBS, {}).get(key)
+    if shared is None or shared.users > 0:
+        return
+    if shared.disconnect:
+        shared.disconnect.cancel()
+        shared.disconnect = None
+    await _async_disconnect_idle(hass, key)
+
+
+async def _async_disconnect_all(hass: HomeAssistant, _event: Event) -> None:
+    """Disconnect every shared client when Home Assistant stops."""
+    hubs = hass.data.get(DATA_HUBS, {})
+    shared_hubs = list(hubs.values())
+    hubs.clear()
+    for shared in shared_hubs:
+        if shared.disconnect:
+            shared.disconnect.cancel()
+            shared.disconnect = None
+    await asyncio.gather(
+        *(shared.hub.disconnect() for shared in shared_hubs), return_exceptions=True
+    )
+
+
+async def _async_disconnect_idle(
+    hass: HomeAssistant, key: tuple[str, int, str | None]
+) -> None:
+    """Disconnect a shared client that is still unused."""
+    hubs = hass.data.get(DATA_HUBS, {})
+    shared = hubs.get(key)
+    if shared is None or shared.users > 0:
+        return
+    del hubs[key]
+    _LOGGER.debug("Disconnecting idle hub client %s:%s", key[0], key[1])
+    await shared.hub.disconnect()
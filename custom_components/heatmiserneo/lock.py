@@ -2,13 +2,13 @@
 
 """Heatmiser Neo Binary Sensors via Heatmiser Neo-hub."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 import logging
 import re
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 
 from homeassistant.components.lock import DOMAIN, LockEntity, LockEntityDescription
 from homeassistant.const import ATTR_CODE
@@ -17,9 +17,9 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HeatmiserNeoConfigEntry
-from .const import HEATMISER_TYPE_IDS_LOCK
 from .coordinator import HeatmiserNeoCoordinator
 from .entity import HeatmiserNeoEntity, HeatmiserNeoEntityDescription
+from .models import Capability, NeoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,16 +38,18 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Locks")
 
-    async_add_entities(
-        HeatmiserNeoLockEntity(neodevice, coordinator, hub, description)
-        for description in LOCKS
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoLockEntity(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(LOCKS, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
 
 # Ideally we would set this on the lock entity itself
@@ -69,12 +71,12 @@ async def _async_lock_device(entity: HeatmiserNeoEntity, **kwargs):
                 "code_format": pin_format,
             },
         )
-    await entity.data.set_lock(int(code))
+    await entity.coordinator.hub.set_lock(int(code), [entity.data])
 
 
 async def _async_unlock_device(entity: HeatmiserNeoEntity):
     """Unlock a thermostat."""
-    await entity.data.unlock()
+    await entity.coordinator.hub.unlock([entity.data])
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -97,9 +99,7 @@ LOCKS: tuple[HeatmiserNeoLockEntityDescription, ...] = (
         default_pin_fn=lambda entity: entity.data.pin_number,
         lock_fn=_async_lock_device,
         unlock_fn=_async_unlock_device,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_LOCK
-        ),
+        capabilities=Capability.LOCK,
     ),
 )
 
@@ -109,7 +109,7 @@ class HeatmiserNeoLockEntity(HeatmiserNeoEntity, LockEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoLockEntityDescription,
@@ -126,13 +126,13 @@ class HeatmiserNeoLockEntity(HeatmiserNeoEntity, LockEntity):
     async def async_lock(self, **kwargs):
         """Turn the entity on."""
         await self.entity_description.lock_fn(self, **kwargs)
-        self.data.lock = True
+        self.coordinator.set_optimistic(self.data, lock=True)
         self.coordinator.async_update_listeners()
 
     async def async_unlock(self, **kwargs):
         """Turn the entity off."""
         await self.entity_description.unlock_fn(self)
-        self.data.lock = False
+        self.coordinator.set_optimistic(self.data, lock=False)
         self.coordinator.async_update_listeners()
 
     @callback
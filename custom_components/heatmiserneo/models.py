@@ -0,0 +1,377 @@
+# SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
+"""Compact device snapshots for the HeatmiserNeo integration."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+import enum
+import math
+import time
+from typing import Any
+
+from neohubapi.neohub import NeoStat
+
+from homeassistant.components.climate import HVACAction
+
+from .const import (
+    HEATMISER_TYPE_IDS_AWAY,
+    HEATMISER_TYPE_IDS_HC,
+    HEATMISER_TYPE_IDS_HOLD,
+    HEATMISER_TYPE_IDS_IDENTIFY,
+    HEATMISER_TYPE_IDS_LOCK,
+    HEATMISER_TYPE_IDS_PLUG,
+    HEATMISER_TYPE_IDS_REPEATER,
+    HEATMISER_TYPE_IDS_STANDBY,
+    HEATMISER_TYPE_IDS_THERMOSTAT,
+    HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC,
+    HEATMISER_TYPE_IDS_TIMER,
+    GlobalSystemType,
+)
+
+# Attributes copied as-is from the NeoStat objects built by neohubapi.
+NEOSTAT_FIELDS = (
+    "name",
+    "device_id",
+    "device_type",
+    "serial_number",
+    "stat_version",
+    "time_clock_mode",
+    "battery_powered",
+    "offline",
+    "low_battery",
+    "temperature",
+    "target_temperature",
+    "cool_temp",
+    "current_floor_temperature",
+    "heat_on",
+    "cool_on",
+    "preheat_active",
+    "fan_speed",
+    "fan_control",
+    "hc_mode",
+    "sensor_mode",
+    "standby",
+    "away",
+    "holiday",
+    "hold_on",
+    "hold_time",
+    "hold_temp",
+    "hold_cool",
+    "timer_on",
+    "manual_off",
+    "lock",
+    "pin_number",
+    "window_open",
+    "floor_limit",
+    "temporary_set_flag",
+    "active_profile",
+    "weekday",
+    "max_temperature_limit",
+    "min_temperature_limit",
+)
+
+# Raw hub values the platforms read, keyed by snapshot attribute name.
+RAW_FIELDS = {
+    "zone_name": "ZONE_NAME",
+    "device_time": "TIME",
+    "frost_temp": "FROST_TEMP",
+    "switching_differential": "SWITCHING DIFFERENTIAL",
+    "max_preheat": "MAX_PREHEAT",
+    "output_delay": "OUTPUT_DELAY",
+    "eng_floor_limit": "ENG_FLOOR_LIMIT",
+    "user_limit": "USER_LIMIT",
+}
+
+
+class NeoDevice:
+    """Snapshot of the NeoStat fields used by the platforms.
+
+    Hub commands only need the name and device id of their targets, so a
+    snapshot can be passed wherever neohubapi expects a list of NeoStats.
+    """
+
+    __slots__ = (*NEOSTAT_FIELDS, *RAW_FIELDS)
+
+    def __init__(self, neostat: NeoStat) -> None:
+        """Initialize the snapshot from a polled NeoStat."""
+        self.update(neostat)
+
+    def update(self, neostat: NeoStat) -> None:
+        """Refresh the snapshot in place from a newly polled NeoStat."""
+        for field in NEOSTAT_FIELDS:
+            setattr(self, field, getattr(neostat, field, None))
+        raw = neostat._data_
+        for field, key in RAW_FIELDS.items():
+            setattr(self, field, getattr(raw, key, None))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        """Return a short representation of the snapshot."""
+        return f"NeoDevice({self.name!r}, device_id={self.device_id!r})"
+
+
+class NeoDeviceStore(Mapping[str, NeoDevice]):
+    """The devices of a hub keyed by name, with columnar views across devices."""
+
+    __slots__ = ("_columns", "_devices")
+
+    def __init__(self, devices: dict[str, NeoDevice]) -> None:
+        """Initialize the store."""
+        self._devices = devices
+        self._columns: dict[str, array] = {}
+
+    @classmethod
+    def from_neostats(
+        cls, neostats: Iterable[NeoStat], previous: NeoDeviceStore | None = None
+    ) -> NeoDeviceStore:
+        """Build a store, updating the snapshots of already known devices in place."""
+        known = previous._devices if previous else {}  # noqa: SLF001
+        devices: dict[str, NeoDevice] = {}
+        for neostat in neostats:
+            device = known.get(neostat.name)
+            if device is None:
+                device = NeoDevice(neostat)
+            else:
+                device.update(neostat)
+            devices[neostat.name] = device
+        return cls(devices)
+
+    def __getitem__(self, name: str) -> NeoDevice:
+        """Return a device by name."""
+        return self._devices[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over device names."""
+        return iter(self._devices)
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._devices)
+
+    def column(self, field: str) -> array:
+        """Return a numeric field for every device, in store order.
+
+        Values that are missing or not numeric are stored as NaN. A column is
+        built on first use and kept until the store is replaced on the next poll.
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = array(
+                "d", (as_float(getattr(d, field)) for d in self._devices.values())
+            )
+            self._columns[field] = column
+        return column
+
+
+class PendingWrites:
+    """Values written to devices that the hub has not reported back yet.
+
+    The hub can take a while to apply a command, so a poll made soon after a
+    write may still return the old value. Pending values are overlaid on
+    each new snapshot until the hub reports the same value or they expire.
+    """
+
+    __slots__ = ("_timeout", "_writes")
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize an empty ledger."""
+        self._timeout = timeout
+        self._writes: dict[str, dict[str, tuple[Any, float]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of devices with pending writes."""
+        return len(self._writes)
+
+    def add(self, device: NeoDevice, field: str, value: Any) -> None:
+        """Record a value written to a device field."""
+        expires = time.monotonic() + self._timeout
+        self._writes.setdefault(device.name, {})[field] = (value, expires)
+
+    def overlay(self, devices: Mapping[str, NeoDevice]) -> None:
+        """Apply pending values to new snapshots, dropping confirmed ones."""
+        now = time.monotonic()
+        for name, writes in list(self._writes.items()):
+            device = devices.get(name)
+            if device is None:
+                del self._writes[name]
+                continue
+            for field, (value, expires) in list(writes.items()):
+                if expires <= now or same_value(getattr(device, field), value):
+                    del writes[field]
+                else:
+                    setattr(device, field, value)
+            if not writes:
+                del self._writes[name]
+
+
+def device_entity_unique_id(device: NeoDevice, hub_serial_number: str, key: str) -> str:
+    """Return the unique id of the entity of a device for a description key."""
+    return f"{device.name}_{hub_serial_number}_{device.serial_number}_{key}"
+
+
+def same_value(reported: Any, written: Any) -> bool:
+    """Compare a value reported by the hub with the value written to it."""
+    if reported == written:
+        return True
+    reported_float = as_float(reported)
+    return not math.isnan(reported_float) and reported_float == as_float(written)
+
+
+class Capability(enum.IntFlag):
+    """What a device supports, used to decide which entities it gets."""
+
+    THERMOSTAT = enum.auto()
+    THERMOSTAT_NOT_HC = enum.auto()
+    HC = enum.auto()
+    TIMER = enum.auto()
+    PLUG = enum.auto()
+    REPEATER = enum.auto()
+    CONTACT_SENSOR = enum.auto()
+    AIR_SENSOR = enum.auto()
+    HOLD = enum.auto()
+    AWAY = enum.auto()
+    STANDBY = enum.auto()
+    IDENTIFY = enum.auto()
+    LOCK = enum.auto()
+    # Operating as a thermostat, or as a time clock (timer).
+    STAT_MODE = enum.auto()
+    TIME_CLOCK_MODE = enum.auto()
+    FLOOR_SENSOR = enum.auto()
+    BATTERY = enum.auto()
+    # Allowed to heat or cool by the global system type of the hub.
+    CAN_HEAT = enum.auto()
+    CAN_COOL = enum.auto()
+
+    CLIMATE = THERMOSTAT | STAT_MODE
+
+
+# Capabilities given by the device types in each set.
+_TYPE_CAPABILITIES = (
+    (HEATMISER_TYPE_IDS_THERMOSTAT, Capability.THERMOSTAT),
+    (HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC, Capability.THERMOSTAT_NOT_HC),
+    (HEATMISER_TYPE_IDS_HC, Capability.HC),
+    (HEATMISER_TYPE_IDS_TIMER, Capability.TIMER),
+    (HEATMISER_TYPE_IDS_PLUG, Capability.PLUG),
+    (HEATMISER_TYPE_IDS_REPEATER, Capability.REPEATER),
+    ({5}, Capability.CONTACT_SENSOR),
+    ({14}, Capability.AIR_SENSOR),
+    (HEATMISER_TYPE_IDS_HOLD, Capability.HOLD),
+    (HEATMISER_TYPE_IDS_AWAY, Capability.AWAY),
+    (HEATMISER_TYPE_IDS_STANDBY, Capability.STANDBY),
+    (HEATMISER_TYPE_IDS_IDENTIFY, Capability.IDENTIFY),
+    (HEATMISER_TYPE_IDS_LOCK, Capability.LOCK),
+)
+_TYPE_CAPABILITY_CACHE: dict[Any, Capability] = {}
+
+
+def device_capabilities(device: NeoDevice, system_data: Any) -> Capability:
+    """Return the capabilities of a device."""
+    capabilities = _TYPE_CAPABILITY_CACHE.get(device.device_type)
+    if capabilities is None:
+        capabilities = Capability(0)
+        for type_ids, capability in _TYPE_CAPABILITIES:
+            if device.device_type in type_ids:
+                capabilities |= capability
+        _TYPE_CAPABILITY_CACHE[device.device_type] = capabilities
+
+    capabilities |= (
+        Capability.TIME_CLOCK_MODE if device.time_clock_mode else Capability.STAT_MODE
+    )
+    if as_float(device.current_floor_temperature) < 127:
+        capabilities |= Capability.FLOOR_SENSOR
+    if device.battery_powered:
+        capabilities |= Capability.BATTERY
+
+    system_type = getattr(system_data, "GLOBAL_SYSTEM_TYPE", None)
+    if capabilities & Capability.THERMOSTAT_NOT_HC or (
+        capabilities & Capability.HC and system_type != GlobalSystemType.COOL_ONLY
+    ):
+        capabilities |= Capability.CAN_HEAT
+    if capabilities & Capability.HC and system_type != GlobalSystemType.HEAT_ONLY:
+        capabilities |= Capability.CAN_COOL
+    return capabilities
+
+
+@dataclass(frozen=True, slots=True)
+class HubSummary:
+    """Aggregate state of the devices on a hub."""
+
+    zones_heating: int = 0
+    zones_cooling: int = 0
+    zones_offline: int = 0
+    low_battery: int = 0
+    min_temperature: float | None = None
+    max_temperature: float | None = None
+    mean_temperature: float | None = None
+
+
+# Devices whose temperature is a room temperature.
+_ROOM_SENSORS = (Capability.CLIMATE, Capability.AIR_SENSOR)
+
+
+def hub_summary(
+    devices: NeoDeviceStore, capabilities: Mapping[str, Capability]
+) -> HubSummary:
+    """Summarize the devices of a hub in a single pass over the store."""
+    heating = cooling = offline = low_battery = 0
+    temperatures = []
+    for device, temperature in zip(
+        devices.values(), devices.column("temperature"), strict=True
+    ):
+        if device.low_battery:
+            low_battery += 1
+        if device.offline:
+            offline += 1
+            continue
+        caps = capabilities.get(device.name, Capability(0))
+        if caps & Capability.CLIMATE == Capability.CLIMATE:
+            heating += bool(device.heat_on)
+            cooling += bool(device.cool_on)
+        # 127 and above mean that the sensor is not connected.
+        if temperature < 127 and any(caps & c == c for c in _ROOM_SENSORS):
+            temperatures.append(temperature)
+
+    if not temperatures:
+        return HubSummary(heating, cooling, offline, low_battery)
+    return HubSummary(
+        heating,
+        cooling,
+        offline,
+        low_battery,
+        min(temperatures),
+        max(temperatures),
+        round(math.fsum(temperatures) / len(temperatures), 1),
+    )
+
+
+def as_float(value: Any) -> float:
+    """Convert a hub value to a float, or NaN if it is not numeric."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def device_hvac_action(device: NeoDevice) -> HVACAction:
+    """Return the current HVAC action (heating, cooling) of a device."""
+    # See: https://developers.home-assistant.io/docs/core/entity/climate/
+    if device.preheat_active:
+        return HVACAction.PREHEATING
+    if device.cool_on:
+        return HVACAction.COOLING
+    if device.heat_on:
+        return HVACAction.HEATING
+    if device.fan_speed != "Off":
+        return HVACAction.FAN  # Should fan be combined? Ie can you have fan on and other functions together?
+    if device.standby or device.away or device.holiday:
+        if device.frost_temp >= 127:
+            # If the frost protection temperature is not set, then the thermostat is truly off.
+            return HVACAction.OFF
+    return HVACAction.IDLE
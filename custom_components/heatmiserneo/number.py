@@ -1,12 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
 """Heatmiser Neo Number platform."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 import logging
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -15,13 +15,14 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HeatmiserNeoConfigEntry
-from .const import HEATMISER_TEMPERATURE_UNIT_HA_UNIT, HEATMISER_TYPE_IDS_THERMOSTAT
+from .const import HEATMISER_TEMPERATURE_UNIT_HA_UNIT
 from .coordinator import HeatmiserNeoCoordinator
 from .entity import HeatmiserNeoEntity, HeatmiserNeoEntityDescription
+from .models import Capability, NeoDevice, same_value
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,9 +33,9 @@ class HeatmiserNeoNumberEntityDescription(
 ):
     """Describes a number entity."""
 
-    value_fn: Callable[[NeoStat], Any]
+    value_fn: Callable[[NeoDevice], Any]
     set_value_fn: Callable[[HeatmiserNeoEntity, float], Awaitable[None]]
-    unit_of_measurement_fn: Callable[[NeoStat, Any], Any] | None = None
+    unit_of_measurement_fn: Callable[[NeoDevice, Any], Any] | None = None
 
 
 async def async_setup_entry(
@@ -51,40 +52,42 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Device Numbers")
 
-    async_add_entities(
-        HeatmiserNeoNumber(neodevice, coordinator, hub, description)
-        for description in NUMBERS
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoNumber(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(NUMBERS, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
 
 async def async_set_frost_temperature(entity: HeatmiserNeoEntity, val: float) -> None:
     """Set the frost temperature on a device."""
-    await entity.data.set_frost_temp(val)
-    setattr(entity.data._data_, "FROST_TEMP", val)
+    await entity.coordinator.hub.set_frost_temp(val, [entity.data])
+    entity.coordinator.set_optimistic(entity.data, frost_temp=val)
 
 
 async def async_set_output_delay(entity: HeatmiserNeoEntity, val: float) -> None:
     """Set the output delay on a device."""
-    await entity.data.set_output_delay(int(val))
-    setattr(entity.data._data_, "OUTPUT_DELAY", int(val))
+    await entity.coordinator.hub.set_output_delay(int(val), [entity.data])
+    entity.coordinator.set_optimistic(entity.data, output_delay=int(val))
 
 
 async def async_set_floor_limit(entity: HeatmiserNeoEntity, val: float) -> None:
     """Set the floor limit temperature on a device."""
-    await entity.data.set_floor_limit(int(val))
-    setattr(entity.data._data_, "ENG_FLOOR_LIMIT", int(val))
+    await entity.coordinator.hub.set_floor_limit(int(val), [entity.data])
+    entity.coordinator.set_optimistic(entity.data, eng_floor_limit=int(val))
 
 
 async def async_set_user_limit(entity: HeatmiserNeoEntity, val: int) -> None:
     """Set the user limit temperature on a device."""
-    await entity.data.set_user_limit(int(val))
-    setattr(entity.data._data_, "USER_LIMIT", int(val))
+    await entity.coordinator.hub.set_user_limit(int(val), [entity.data])
+    entity.coordinator.set_optimistic(entity.data, user_limit=int(val))
 
 
 NUMBERS: tuple[HeatmiserNeoNumberEntityDescription, ...] = (
@@ -94,11 +97,8 @@ NUMBERS: tuple[HeatmiserNeoNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
-        value_fn=lambda dev: dev._data_.FROST_TEMP,
+        capabilities=Capability.CLIMATE,
+        value_fn=lambda dev: dev.frost_temp,
         set_value_fn=async_set_frost_temperature,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
@@ -114,11 +114,8 @@ NUMBERS: tuple[HeatmiserNeoNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.DURATION,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
-        value_fn=lambda dev: dev._data_.OUTPUT_DELAY,
+        capabilities=Capability.CLIMATE,
+        value_fn=lambda dev: dev.output_delay,
         set_value_fn=async_set_output_delay,
         native_min_value=0,
         native_max_value=15,
@@ -131,12 +128,8 @@ NUMBERS: tuple[HeatmiserNeoNumberEntityDescription, ...] = (
         device_class=NumberDeviceClass.TEMPERATURE,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-            and device.current_floor_temperature < 127
-        ),
-        value_fn=lambda dev: dev._data_.ENG_FLOOR_LIMIT,
+        capabilities=Capability.CLIMATE | Capability.FLOOR_SENSOR,
+        value_fn=lambda dev: dev.eng_floor_limit,
         set_value_fn=async_set_floor_limit,
         native_step=1,
         unit_of_measurement_fn=lambda _, sys_data: (
@@ -149,11 +142,8 @@ NUMBERS: tuple[HeatmiserNeoNumberEntityDescription, ...] = (
         name="User Limit",
         device_class=NumberDeviceClass.TEMPERATURE,
         entity_category=EntityCategory.CONFIG,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
-        value_fn=lambda dev: dev._data_.USER_LIMIT,
+        capabilities=Capability.CLIMATE,
+        value_fn=lambda dev: dev.user_limit,
         set_value_fn=async_set_user_limit,
         native_step=1,
         native_min_value=0,
@@ -171,7 +161,7 @@ class HeatmiserNeoNumber(HeatmiserNeoEntity, NumberEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoNumberEntityDescription,
@@ -191,6 +181,8 @@ class HeatmiserNeoNumber(HeatmiserNeoEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Change the number."""
+        if same_value(self.native_value, value):
+            return
         await self.entity_description.set_value_fn(self, value)
         self.coordinator.async_update_listeners()
 
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0 OR GPL-2.0-only
+"""Cumulative heating and cooling runtime for the HeatmiserNeo integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.components.climate import HVACAction
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, HEATMISER_TYPE_IDS_THERMOSTAT
+from .models import NeoDevice, device_hvac_action
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300
+
+# Actions with a runtime counter. They are mutually exclusive, so heating
+# runtime does not include time spent preheating.
+RUNTIME_ACTIONS = (HVACAction.HEATING, HVACAction.COOLING, HVACAction.PREHEATING)
+
+# Longer gaps between updates (hub unreachable, Home Assistant restarted) are
+# not counted, as the state during the gap is unknown.
+MAX_UPDATE_GAP = 600
+
+
+class RuntimeCounters:
+    """Time spent in each runtime action, per device and for the whole hub.
+
+    Counters are advanced on each coordinator update by the time elapsed
+    since the previous one, attributed to the action each device reported
+    then, and saved to storage so that they survive restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the counters."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.runtime"
+        )
+        self._devices: dict[str, dict[str, float]] = {}
+        self._hub: dict[str, float] = _zero_totals()
+        self._actions: dict[str, str] = {}
+        self._last_update: float | None = None
+
+    async def async_load(self) -> None:
+        """Restore the counters saved by a previous run."""
+        if data := await self._store.async_load():
+            self._devices = data.get("devices", {})
+            self._hub.update(data.get("hub", {}))
+
+    async def async_save(self) -> None:
+        """Save the counters immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the saved counters."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"devices": self._devices, "hub": self._hub}
+
+    def update(self, devices: Iterable[NeoDevice], now: float) -> None:
+        """Advance the counters to now and record the current device actions."""
+        elapsed = None if self._last_update is None else now - self._last_update
+        if elapsed is not None and not 0 < elapsed <= MAX_UPDATE_GAP:
+            elapsed = None
+        self._last_update = now
+
+        for device in devices:
+            if elapsed and (action := self._actions.get(device.name)):
+                totals = self._devices.setdefault(device.name, _zero_totals())
+                totals[action] = totals.get(action, 0.0) + elapsed
+                self._hub[action] += elapsed
+            action = _runtime_action(device)
+            if action:
+                self._actions[device.name] = action
+            else:
+                self._actions.pop(device.name, None)
+
+        if elapsed:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def remove_device(self, name: str) -> None:
+        """Drop the counters of a device that has left the hub."""
+        self._actions.pop(name, None)
+        if self._devices.pop(name, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def device_hours(self, name: str, action: HVACAction) -> float:
+        """Return the hours a device has spent in an action."""
+        return round(self._devices.get(name, {}).get(action.value, 0.0) / 3600, 3)
+
+    def hub_hours(self, *actions: HVACAction) -> float:
+        """Return the hours all devices on the hub have spent in any of actions."""
+        return round(sum(self._hub.get(a.value, 0.0) for a in actions) / 3600, 3)
+
+
+def _zero_totals() -> dict[str, float]:
+    return {action.value: 0.0 for action in RUNTIME_ACTIONS}
+
+
+def _runtime_action(device: NeoDevice) -> str | None:
+    """Return the runtime action of a thermostat, if it is in one."""
+    if (
+        device.offline
+        or device.time_clock_mode
+        or device.device_type not in HEATMISER_TYPE_IDS_THERMOSTAT
+    ):
+        return None
+    action = device_hvac_action(device)
+    return action.value if action in RUNTIME_ACTIONS else None
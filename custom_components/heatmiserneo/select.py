@@ -4,13 +4,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from datetime import timedelta
 import logging
 from typing import Final
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 import voluptuous as vol
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
@@ -30,10 +30,6 @@ from .const import (
     CONF_TIMER_HOLD_DURATION,
     CONF_TIMER_OPTIONS,
     DEFAULT_TIMER_HOLD_DURATION,
-    HEATMISER_TYPE_IDS_PLUG,
-    HEATMISER_TYPE_IDS_THERMOSTAT,
-    HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC,
-    HEATMISER_TYPE_IDS_TIMER,
     PROFILE_0,
     SERVICE_GET_DEVICE_PROFILE_DEFINITION,
     SERVICE_TIMER_HOLD_ON,
@@ -49,6 +45,7 @@ from .entity import (
     profile_sensor_enabled_by_default,
 )
 from .helpers import get_profile_definition
+from .models import Capability, NeoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,12 +109,27 @@ async def set_timer_override(
         await entity.async_cancel_away_or_holiday()
         if on and dev.standby:
             await set_timer_standby(entity, False)
-    await dev.set_timer_hold(on, duration)
-    dev.hold_on = state
-    if state:
-        dev.timer_on = on
-        dev.hold_temp = 1 if on else 0
-    dev.hold_time = timedelta(minutes=duration)
+    await _async_set_timer_hold(entity, on, duration)
+
+
+async def _async_set_timer_hold(
+    entity: HeatmiserNeoSelectEntity, on: bool, duration: int
+) -> None:
+    """Set a timer hold, sent together with identical holds on other devices."""
+    dev = entity.data
+    state = duration > 0
+
+    def optimistic() -> None:
+        entity.coordinator.set_optimistic(dev, hold_on=state)
+        if state:
+            entity.coordinator.set_optimistic(
+                dev, timer_on=on, hold_temp=1 if on else 0
+            )
+        dev.hold_time = timedelta(minutes=duration)
+
+    await entity.coordinator.async_device_command(
+        "set_timer_hold", on, duration, device=dev, optimistic=optimistic
+    )
 
 
 async def set_timer_standby(entity: HeatmiserNeoSelectEntity, state: bool = True):
@@ -125,10 +137,10 @@ async def set_timer_standby(entity: HeatmiserNeoSelectEntity, state: bool = True
     dev = entity.data
     if state and dev.hold_on:
         await set_timer_override(entity, dev.hold_temp == 1, 0)
-    await dev.set_frost(state)
-    dev.standby = state
+    await entity.coordinator.hub.set_frost(state, [dev])
+    entity.coordinator.set_optimistic(dev, standby=state)
     if dev.standby:
-        dev.timer_on = False
+        entity.coordinator.set_optimistic(dev, timer_on=False)
 
 
 async def set_plug_auto(entity: HeatmiserNeoSelectEntity):
@@ -163,15 +175,10 @@ async def set_plug_override(
     state = duration > 0
     if turn_off_manual and not dev.manual_off:
         await hub.set_manual(False, [dev])
-        dev.manual_off = True
+        entity.coordinator.set_optimistic(dev, manual_off=True)
     if state:
         await entity.async_cancel_away_or_holiday()
-    await dev.set_timer_hold(on, duration)
-    dev.hold_on = state
-    if state:
-        dev.timer_on = on
-        dev.hold_temp = 1 if on else 0
-    dev.hold_time = timedelta(minutes=duration)
+    await _async_set_timer_hold(entity, on, duration)
 
 
 async def set_plug_manual(entity: HeatmiserNeoSelectEntity, on: bool):
@@ -181,13 +188,13 @@ async def set_plug_manual(entity: HeatmiserNeoSelectEntity, on: bool):
     set_plug_override(entity, dev.hold_temp == 1, 0, False)
     if dev.manual_off:
         await hub.set_manual(True, [dev])
-        dev.manual_off = False
+        entity.coordinator.set_optimistic(dev, manual_off=False)
     if on != dev.timer_on:
         await hub.set_timer(on, [dev])
-        dev.timer_on = on
+        entity.coordinator.set_optimistic(dev, timer_on=on)
 
 
-def _timer_mode(device: NeoStat) -> ModeSelectOption:
+def _timer_mode(device: NeoDevice) -> ModeSelectOption:
     """Decode the timer mode."""
     # If Hub Away, Device can be on standby
     # Else if device on Standby, Hold can be enabled
@@ -231,7 +238,7 @@ async def async_set_dst_mode(coordinator: HeatmiserNeoCoordinator, option: str):
         setattr(coordinator.system_data, "TIMEZONESTR", option)
 
 
-def _timer_icon(device: NeoStat) -> str | None:
+def _timer_icon(device: NeoDevice) -> str | None:
     if device.away or device.holiday:
         if device.standby:
             return "mdi:timer-off-outline"
@@ -245,7 +252,7 @@ def _timer_icon(device: NeoStat) -> str | None:
     return "mdi:timer" if device.timer_on else "mdi:timer-outline"
 
 
-def _plug_mode(device: NeoStat) -> ModeSelectOption:
+def _plug_mode(device: NeoDevice) -> ModeSelectOption:
     if not device.manual_off:
         if device.timer_on:
             return ModeSelectOption.MANUAL_ON
@@ -259,7 +266,7 @@ def _plug_mode(device: NeoStat) -> ModeSelectOption:
     return ModeSelectOption.AUTO
 
 
-def _plug_icon(device: NeoStat) -> str | None:
+def _plug_icon(device: NeoDevice) -> str | None:
     if not device.manual_off:
         if device.timer_on:
             return "mdi:toggle-switch-variant"
@@ -293,8 +300,10 @@ async def async_set_switching_differential(
     val: str, entity: HeatmiserNeoEntity
 ) -> None:
     """Set the switching differential on a device."""
-    await entity.data.set_diff(int(val))
-    setattr(entity.data._data_, "SWITCHING DIFFERENTIAL", int(val))
+    if entity.coordinator.already_set(entity.data, switching_differential=int(val)):
+        return
+    await entity.coordinator.hub.set_diff(int(val), [entity.data])
+    entity.coordinator.set_optimistic(entity.data, switching_differential=int(val))
 
 
 async def async_set_preheat(
@@ -302,8 +311,10 @@ async def async_set_preheat(
     entity: HeatmiserNeoEntity,
 ) -> None:
     """Set the maximum preheat time on a device."""
-    await entity.data.set_preheat(int(val))
-    setattr(entity.data._data_, "MAX_PREHEAT", int(val))
+    if entity.coordinator.already_set(entity.data, max_preheat=int(val)):
+        return
+    await entity.coordinator.hub.set_preheat(int(val), [entity.data])
+    entity.coordinator.set_optimistic(entity.data, max_preheat=int(val))
 
 
 async def async_set_profile(
@@ -330,10 +341,10 @@ async def async_base_set_profile(
 ) -> None:
     """Set the maximum preheat time on a device."""
     if profile_id == 0:
-        await entity.data.clear_profile_id()
+        await entity.coordinator.hub.clear_profile_id([entity.data])
     else:
-        await entity.data.set_profile_id(profile_id)
-    entity.data.active_profile = profile_id
+        await entity.coordinator.hub.set_profile_id(profile_id, [entity.data])
+    entity.coordinator.set_optimistic(entity.data, active_profile=profile_id)
 
 
 async def _async_get_profile_definition(
@@ -372,11 +383,7 @@ SELECT: Final[tuple[HeatmiserNeoSelectEntityDescription, ...]] = (
         key="heatmiser_neo_timer_mode_select",
         name=None,  # This is the main entity of the device
         options=[c.value.lower() for c in TIMER_SET_MODE],
-        setup_filter_fn=lambda device, _: (
-            device.device_type
-            in HEATMISER_TYPE_IDS_TIMER.difference(HEATMISER_TYPE_IDS_PLUG)
-            and device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT | Capability.TIME_CLOCK_MODE,
         value_fn=lambda entity: _timer_mode(entity.data).value,
         set_value_fn=lambda mode, entity: TIMER_SET_MODE.get(ModeSelectOption(mode))(
             entity
@@ -389,7 +396,7 @@ SELECT: Final[tuple[HeatmiserNeoSelectEntityDescription, ...]] = (
         key="heatmiser_neo_plug_mode_select",
         name=None,  # This is the main entity of the device
         options=[c.value.lower() for c in PLUG_SET_MODE],
-        setup_filter_fn=lambda device, _: device.device_type in HEATMISER_TYPE_IDS_PLUG,
+        capabilities=Capability.PLUG,
         value_fn=lambda entity: _plug_mode(entity.data).value,
         set_value_fn=lambda mode, entity: PLUG_SET_MODE.get(ModeSelectOption(mode))(
             entity
@@ -403,13 +410,8 @@ SELECT: Final[tuple[HeatmiserNeoSelectEntityDescription, ...]] = (
         options=[str(n) for n in range(4)],
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
-        value_fn=lambda entity: str(
-            getattr(entity.data._data_, "SWITCHING DIFFERENTIAL")
-        ),
+        capabilities=Capability.CLIMATE,
+        value_fn=lambda entity: str(entity.data.switching_differential),
         set_value_fn=async_set_switching_differential,
         translation_key="switching_differential",
     ),
@@ -418,21 +420,15 @@ SELECT: Final[tuple[HeatmiserNeoSelectEntityDescription, ...]] = (
         options=[str(n) for n in range(6)],
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
-        value_fn=lambda entity: str(entity.data._data_.MAX_PREHEAT),
+        capabilities=Capability.CLIMATE,
+        value_fn=lambda entity: str(entity.data.max_preheat),
         set_value_fn=async_set_preheat,
         translation_key="preheat_time",
     ),
     HeatmiserNeoSelectEntityDescription(
         key="heatmiser_neo_active_profile",
         options_fn=lambda entity: _profile_names(entity.coordinator),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC | Capability.STAT_MODE,
         value_fn=lambda entity: _profile_id_to_name(
             entity.data.active_profile, entity.coordinator
         ),
@@ -447,10 +443,7 @@ SELECT: Final[tuple[HeatmiserNeoSelectEntityDescription, ...]] = (
     HeatmiserNeoSelectEntityDescription(
         key="heatmiser_neo_active_timer_profile",
         options_fn=lambda entity: _timer_profile_names(entity.coordinator),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-            and device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC | Capability.TIME_CLOCK_MODE,
         value_fn=lambda entity: _profile_id_to_name(
             entity.data.active_profile, entity.coordinator
         ),
@@ -524,6 +517,17 @@ HUB_SELECT: Final[tuple[HeatmiserNeoHubSelectEntityDescription, ...]] = (
 )
 
 
+TIMER_HOLD_ON_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_HOLD_DURATION, default=1): hold_duration_validation,
+        vol.Optional(ATTR_HOLD_STATE, default=True): cv.boolean,
+    }
+)
+GET_DEVICE_PROFILE_DEFINITION_SCHEMA = cv.make_entity_service_schema(
+    {vol.Optional(ATTR_FRIENDLY_MODE, default=False): cv.boolean}
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HeatmiserNeoConfigEntry,
@@ -538,7 +542,6 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Select entities")
 
@@ -548,27 +551,23 @@ async def async_setup_entry(
         if description.setup_filter_fn(coordinator)
     )
 
-    async_add_entities(
-        HeatmiserNeoSelectEntity(neodevice, coordinator, hub, description)
-        for description in SELECT
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoSelectEntity(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(SELECT, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
-        SERVICE_TIMER_HOLD_ON,
-        {
-            vol.Required(ATTR_HOLD_DURATION, default=1): hold_duration_validation,
-            vol.Optional(ATTR_HOLD_STATE, default=True): cv.boolean,
-        },
-        call_custom_action,
+        SERVICE_TIMER_HOLD_ON, TIMER_HOLD_ON_SCHEMA, call_custom_action
     )
     platform.async_register_entity_service(
         SERVICE_GET_DEVICE_PROFILE_DEFINITION,
-        {
-            vol.Optional(ATTR_FRIENDLY_MODE, default=False): cv.boolean,
-        },
+        GET_DEVICE_PROFILE_DEFINITION_SCHEMA,
         call_custom_action,
         supports_response=SupportsResponse.ONLY,
     )
@@ -581,7 +580,7 @@ class HeatmiserNeoSelectEntity(HeatmiserNeoEntity, SelectEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: DataUpdateCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoSelectEntityDescription,
@@ -632,6 +631,8 @@ class HeatmiserNeoHubSelectEntity(HeatmiserNeoHubEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        if option == self.entity_description.value_fn(self.coordinator):
+            return
         await self.entity_description.set_value_fn(option, self)
         self.coordinator.async_update_listeners()
 
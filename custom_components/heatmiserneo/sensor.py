@@ -2,14 +2,15 @@
 
 """Heatmiser Neo Sensors via Heatmiser Neo-hub."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 import datetime
+from functools import lru_cache, partial
 import json
 import logging
 from typing import Any
 
-from neohubapi.neohub import NeoHub, NeoStat, ScheduleFormat
+from neohubapi.neohub import NeoHub, ScheduleFormat
 import voluptuous as vol
 
 from homeassistant.components.climate import (
@@ -18,6 +19,7 @@ from homeassistant.components.climate import (
     FAN_LOW,
     FAN_MEDIUM,
     FAN_OFF,
+    HVACAction,
 )
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -25,8 +27,8 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import ATTR_NAME, EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.const import ATTR_NAME, PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
@@ -36,46 +38,18 @@ import homeassistant.util.dt as dt_util
 from . import HeatmiserNeoConfigEntry
 from .const import (
     ATTR_CREATE_MODE,
-    ATTR_FRIDAY_OFF_TIMES,
-    ATTR_FRIDAY_ON_TIMES,
-    ATTR_FRIDAY_TEMPERATURES,
-    ATTR_FRIDAY_TIMES,
     ATTR_FRIENDLY_MODE,
-    ATTR_MONDAY_OFF_TIMES,
-    ATTR_MONDAY_ON_TIMES,
-    ATTR_MONDAY_TEMPERATURES,
-    ATTR_MONDAY_TIMES,
     ATTR_NAME_NEW,
     ATTR_NAME_OLD,
-    ATTR_SATURDAY_OFF_TIMES,
-    ATTR_SATURDAY_ON_TIMES,
-    ATTR_SATURDAY_TEMPERATURES,
-    ATTR_SATURDAY_TIMES,
-    ATTR_SUNDAY_OFF_TIMES,
-    ATTR_SUNDAY_ON_TIMES,
-    ATTR_SUNDAY_TEMPERATURES,
-    ATTR_SUNDAY_TIMES,
-    ATTR_THURSDAY_OFF_TIMES,
-    ATTR_THURSDAY_ON_TIMES,
-    ATTR_THURSDAY_TEMPERATURES,
-    ATTR_THURSDAY_TIMES,
-    ATTR_TUESDAY_OFF_TIMES,
-    ATTR_TUESDAY_ON_TIMES,
-    ATTR_TUESDAY_TEMPERATURES,
-    ATTR_TUESDAY_TIMES,
-    ATTR_WEDNESDAY_OFF_TIMES,
-    ATTR_WEDNESDAY_ON_TIMES,
-    ATTR_WEDNESDAY_TEMPERATURES,
-    ATTR_WEDNESDAY_TIMES,
+    ATTR_ZONE_GROUP,
+    ATTR_ZONES,
     HEATMISER_FAN_SPEED_HA_FAN_MODE,
     HEATMISER_TEMPERATURE_UNIT_HA_UNIT,
-    HEATMISER_TYPE_IDS_HC,
-    HEATMISER_TYPE_IDS_HOLD,
-    HEATMISER_TYPE_IDS_THERMOSTAT,
-    HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC,
     OPTION_CREATE_MODE_CREATE,
     OPTION_CREATE_MODE_UPDATE,
     OPTIONS_CREATE_MODE,
+    PROFILE_0,
+    SERVICE_ASSIGN_PROFILE,
     SERVICE_CREATE_PROFILE_ONE,
     SERVICE_CREATE_PROFILE_SEVEN,
     SERVICE_CREATE_PROFILE_TWO,
@@ -85,6 +59,7 @@ from .const import (
     SERVICE_DELETE_PROFILE,
     SERVICE_GET_PROFILE_DEFINITIONS,
     SERVICE_RENAME_PROFILE,
+    EntityTier,
     GlobalSystemType,
 )
 from .coordinator import HeatmiserNeoCoordinator
@@ -97,6 +72,14 @@ from .entity import (
     profile_sensor_enabled_by_default,
 )
 from .helpers import get_profile_definition, profile_level
+from .history import (
+    DUTY_CYCLE_LONG_WINDOW,
+    DUTY_CYCLE_SHORT_WINDOW,
+    RATE_OF_CHANGE_WINDOW,
+    DeviceHistory,
+)
+from .hub import CircuitState
+from .models import Capability, NeoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -143,6 +126,68 @@ def time_str(value: Any) -> str:
     return time_val.strftime("%H:%M")
 
 
+_TIMES = vol.All(cv.ensure_list, [time_str])
+_TEMPERATURES = vol.All(cv.ensure_list, [vol.Coerce(float)])
+
+# Profile format and whether the profile is a timer one, for each create service.
+CREATE_PROFILE_SERVICES = {
+    SERVICE_CREATE_PROFILE_ONE: (ScheduleFormat.ONE, False),
+    SERVICE_CREATE_PROFILE_TWO: (ScheduleFormat.TWO, False),
+    SERVICE_CREATE_PROFILE_SEVEN: (ScheduleFormat.SEVEN, False),
+    SERVICE_CREATE_TIMER_PROFILE_ONE: (ScheduleFormat.ONE, True),
+    SERVICE_CREATE_TIMER_PROFILE_TWO: (ScheduleFormat.TWO, True),
+    SERVICE_CREATE_TIMER_PROFILE_SEVEN: (ScheduleFormat.SEVEN, True),
+}
+
+
+def _create_profile_schema(weekdays: list[str], timer: bool) -> vol.Schema:
+    """Build the schema of a create profile service from its weekdays."""
+    schema: dict[vol.Marker, Any] = {
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
+            OPTIONS_CREATE_MODE
+        ),
+    }
+    for weekday in weekdays:
+        if timer:
+            schema[vol.Required(f"{weekday}_on_times")] = _TIMES
+            schema[vol.Required(f"{weekday}_off_times")] = _TIMES
+        else:
+            schema[vol.Required(f"{weekday}_times")] = _TIMES
+            schema[vol.Required(f"{weekday}_temperatures")] = _TEMPERATURES
+    return cv.make_entity_service_schema(schema)
+
+
+# Service schemas are built once, when the platform is imported, and shared
+# by every config entry.
+CREATE_PROFILE_SCHEMAS = {
+    service: _create_profile_schema(SCHEDULE_WEEKDAYS[profile_format], timer)
+    for service, (profile_format, timer) in CREATE_PROFILE_SERVICES.items()
+}
+RENAME_PROFILE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_NAME_OLD): cv.string,
+        vol.Required(ATTR_NAME_NEW): cv.string,
+    }
+)
+DELETE_PROFILE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required(ATTR_NAME): cv.string}
+)
+ASSIGN_PROFILE_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Required(ATTR_NAME): cv.string,
+            vol.Optional(ATTR_ZONES): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_ZONE_GROUP): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ZONES, ATTR_ZONE_GROUP),
+)
+GET_PROFILE_DEFINITIONS_SCHEMA = cv.make_entity_service_schema(
+    {vol.Optional(ATTR_FRIENDLY_MODE, default=False): cv.boolean}
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HeatmiserNeoConfigEntry,
@@ -157,7 +202,6 @@ async def async_setup_entry(
         return
 
     neo_devices, _ = coordinator.data
-    system_data = coordinator.system_data
 
     _LOGGER.info("Adding Neo Sensors")
 
@@ -167,152 +211,31 @@ async def async_setup_entry(
         if description.setup_filter_fn(coordinator)
     )
 
-    async_add_entities(
-        HeatmiserNeoSensor(neodevice, coordinator, hub, description)
-        for description in SENSORS
-        for neodevice in neo_devices.values()
-        if description.setup_filter_fn(neodevice, system_data)
-    )
+    @callback
+    def _async_add_devices(devices: Iterable[NeoDevice]) -> None:
+        async_add_entities(
+            HeatmiserNeoSensor(neodevice, coordinator, hub, description)
+            for neodevice, description in coordinator.entity_plan(SENSORS, devices)
+        )
+
+    _async_add_devices(neo_devices.values())
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
-        SERVICE_RENAME_PROFILE,
-        {
-            vol.Required(ATTR_NAME_OLD): cv.string,
-            vol.Required(ATTR_NAME_NEW): cv.string,
-        },
-        call_custom_action,
-    )
-    platform.async_register_entity_service(
-        SERVICE_DELETE_PROFILE,
-        {vol.Required(ATTR_NAME): cv.string},
-        call_custom_action,
-    )
-    platform.async_register_entity_service(
-        SERVICE_CREATE_PROFILE_ONE,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_SUNDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-        },
-        call_custom_action,
-    )
-    platform.async_register_entity_service(
-        SERVICE_CREATE_PROFILE_TWO,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_MONDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_MONDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_SUNDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-        },
-        call_custom_action,
-    )
-    platform.async_register_entity_service(
-        SERVICE_CREATE_PROFILE_SEVEN,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_MONDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_MONDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_TUESDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_TUESDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_WEDNESDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_WEDNESDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_THURSDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_THURSDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_FRIDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_FRIDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_SATURDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SATURDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-            vol.Required(ATTR_SUNDAY_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_TEMPERATURES): vol.All(
-                cv.ensure_list, [vol.Coerce(float)]
-            ),
-        },
-        call_custom_action,
-    )
-    platform.async_register_entity_service(
-        SERVICE_CREATE_TIMER_PROFILE_ONE,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_SUNDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-        },
-        call_custom_action,
+        SERVICE_RENAME_PROFILE, RENAME_PROFILE_SCHEMA, call_custom_action
     )
     platform.async_register_entity_service(
-        SERVICE_CREATE_TIMER_PROFILE_TWO,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_MONDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_MONDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-        },
-        call_custom_action,
+        SERVICE_DELETE_PROFILE, DELETE_PROFILE_SCHEMA, call_custom_action
     )
     platform.async_register_entity_service(
-        SERVICE_CREATE_TIMER_PROFILE_SEVEN,
-        {
-            vol.Required(ATTR_NAME): cv.string,
-            vol.Optional(ATTR_CREATE_MODE, default=OPTION_CREATE_MODE_CREATE): vol.In(
-                OPTIONS_CREATE_MODE
-            ),
-            vol.Required(ATTR_MONDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_MONDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_TUESDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_TUESDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_WEDNESDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_WEDNESDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_THURSDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_THURSDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_FRIDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_FRIDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SATURDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SATURDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_ON_TIMES): vol.All(cv.ensure_list, [time_str]),
-            vol.Required(ATTR_SUNDAY_OFF_TIMES): vol.All(cv.ensure_list, [time_str]),
-        },
-        call_custom_action,
+        SERVICE_ASSIGN_PROFILE, ASSIGN_PROFILE_SCHEMA, call_custom_action
     )
+    for service, schema in CREATE_PROFILE_SCHEMAS.items():
+        platform.async_register_entity_service(service, schema, call_custom_action)
     platform.async_register_entity_service(
         SERVICE_GET_PROFILE_DEFINITIONS,
-        {
-            vol.Optional(ATTR_FRIENDLY_MODE, default=False): cv.boolean,
-        },
+        GET_PROFILE_DEFINITIONS_SCHEMA,
         call_custom_action,
         supports_response=SupportsResponse.ONLY,
     )
@@ -332,11 +255,8 @@ async def async_rename_profile(
     if conflicting_profile_id:
         raise HomeAssistantError(f"New name '{new_name}' already in use")
 
-    await entity.coordinator.hub.rename_profile(old_name, new_name)
-    if timer:
-        entity.coordinator.timer_profiles[profile_id].name = new_name
-    else:
-        entity.coordinator.profiles[profile_id].name = new_name
+    await coordinator.hub.rename_profile(old_name, new_name)
+    await coordinator.async_refresh_profiles(timer)
 
 
 async def async_delete_profile(
@@ -349,11 +269,62 @@ async def async_delete_profile(
     if not profile_id:
         raise HomeAssistantError(f"Profile '{profile_name}' does not exist")
 
-    await entity.coordinator.hub.delete_profile(profile_name)
-    if timer:
-        del entity.coordinator.timer_profiles[profile_id]
+    await coordinator.hub.delete_profile(profile_name)
+    # Devices using a deleted profile fall back to PROFILE_0
+    coordinator.update_in_memory_state(
+        lambda device: setattr(device, "active_profile", 0),
+        lambda device: device.active_profile == profile_id,
+    )
+    await coordinator.async_refresh_profiles(timer)
+
+
+async def async_assign_profile(
+    entity: HeatmiserNeoHubEntity, service_call: ServiceCall
+):
+    """Assign a profile to several devices with a single command."""
+    coordinator = entity.coordinator
+    profile_name = service_call.data[ATTR_NAME]
+    if profile_name == PROFILE_0:
+        profile_id, timer = 0, None
     else:
-        del entity.coordinator.profiles[profile_id]
+        profile_id, timer = _check_profile_name(profile_name, coordinator)
+        if not profile_id:
+            raise HomeAssistantError(f"Profile '{profile_name}' does not exist")
+
+    zones = list(service_call.data.get(ATTR_ZONES, []))
+    if zone_group := service_call.data.get(ATTR_ZONE_GROUP):
+        groups = await coordinator.async_get_zone_groups()
+        if zone_group not in groups:
+            raise HomeAssistantError(f"Zone group '{zone_group}' does not exist")
+        zones.extend(z for z in groups[zone_group] if z not in zones)
+
+    neo_devices, _ = coordinator.data
+    devices = []
+    for zone in zones:
+        device = neo_devices.get(zone)
+        # The same devices that get an active profile select.
+        if not device or not (
+            coordinator.capabilities.get(zone, Capability(0))
+            & Capability.THERMOSTAT_NOT_HC
+        ):
+            raise HomeAssistantError(f"Zone '{zone}' does not support profiles")
+        if timer is not None and bool(device.time_clock_mode) != timer:
+            raise HomeAssistantError(
+                f"Zone '{zone}' can't use a {'timer' if timer else 'heating'} profile"
+            )
+        devices.append(device)
+    if not devices:
+        raise HomeAssistantError("No zones to assign the profile to")
+
+    if profile_id == 0:
+        await coordinator.hub.clear_profile_id(devices)
+    else:
+        await coordinator.hub.set_profile_id(profile_id, devices)
+    for device in devices:
+        coordinator.set_optimistic(device, active_profile=profile_id)
+
+    coordinator.async_update_listeners()
+    await coordinator.async_request_refresh()
 
 
 async def async_get_profile_definitions(
@@ -436,7 +407,7 @@ async def async_create_profile(
     _LOGGER.debug("Create profile - msg=%s", json.dumps(msg))
     await entity.coordinator.hub._send(msg, reply)  # noqa: SLF001
 
-    await coordinator.async_request_refresh()
+    await coordinator.async_refresh_profiles(timer)
 
 
 def _convert_to_profile_info(
@@ -518,7 +489,7 @@ class HeatmiserNeoSensorEntityDescription(
     """Describes a button entity."""
 
     value_fn: Callable[[HeatmiserNeoEntity], Any]
-    unit_of_measurement_fn: Callable[[NeoStat, Any], Any] | None = None
+    unit_of_measurement_fn: Callable[[NeoDevice, Any], Any] | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -528,6 +499,7 @@ class HeatmiserNeoHubSensorEntityDescription(
     """Describes a button entity."""
 
     value_fn: Callable[[HeatmiserNeoCoordinator], Any]
+    unit_of_measurement_fn: Callable[[Any], Any] | None = None
 
 
 SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
@@ -541,9 +513,18 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
             if device.data.hold_on
             else None
         ),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_HOLD
+        capabilities=Capability.HOLD,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_hold_end_sensor",
+        name="Hold Ends At",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda device: (
+            device.coordinator.hold_ends.get(device.data.name)
+            if device.data.hold_on
+            else None
         ),
+        capabilities=Capability.HOLD,
     ),
     HeatmiserNeoSensorEntityDescription(
         key="heatmiser_neo_temperature_sensor",
@@ -551,7 +532,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         name=None,  # This is the main entity of the device
         value_fn=lambda device: device.data.temperature,
-        setup_filter_fn=lambda device, _: device.device_type == 14,
+        capabilities=Capability.AIR_SENSOR,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -563,10 +544,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         name="Current Temperature",
         value_fn=lambda device: device.data.temperature,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.CLIMATE,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -579,10 +557,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         name="Device Temperature",
         value_fn=lambda device: device.data.temperature,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT | Capability.TIME_CLOCK_MODE,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -594,11 +569,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         name="Floor Temperature",
         value_fn=lambda device: device.data.current_floor_temperature,
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT
-            and not device.time_clock_mode
-            and device.current_floor_temperature < 127
-        ),
+        capabilities=Capability.CLIMATE | Capability.FLOOR_SENSOR,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -608,16 +579,8 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         name="Hold Temperature",
         value_fn=lambda device: device.data.hold_temp if device.data.hold_on else None,
-        setup_filter_fn=lambda device, sys_data: (
-            (
-                device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-                or (
-                    device.device_type in HEATMISER_TYPE_IDS_HC
-                    and sys_data.GLOBAL_SYSTEM_TYPE != GlobalSystemType.COOL_ONLY
-                )
-            )
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.CAN_HEAT | Capability.STAT_MODE,
+        entity_tier=EntityTier.EXTENDED,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -627,11 +590,8 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         name="Hold Cooling Temperature",
         value_fn=lambda device: device.data.hold_cool if device.data.hold_on else None,
-        setup_filter_fn=lambda device, sys_data: (
-            device.device_type in HEATMISER_TYPE_IDS_HC
-            and not device.time_clock_mode
-            and sys_data.GLOBAL_SYSTEM_TYPE != GlobalSystemType.HEAT_ONLY
-        ),
+        capabilities=Capability.CAN_COOL | Capability.STAT_MODE,
+        entity_tier=EntityTier.EXTENDED,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -646,9 +606,8 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
             if device.data.fan_control != "Manual"
             else HEATMISER_FAN_SPEED_HA_FAN_MODE.get(device.data.fan_speed, FAN_OFF)
         ),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_HC and not device.time_clock_mode
-        ),
+        capabilities=Capability.HC | Capability.STAT_MODE,
+        entity_tier=EntityTier.EXTENDED,
     ),
     HeatmiserNeoSensorEntityDescription(
         key="heatmiser_neo_profile_current_temp",
@@ -657,10 +616,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         value_fn=lambda device: _profile_current_temp(
             device.data.active_profile, device
         ),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC | Capability.STAT_MODE,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -671,10 +627,7 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         name="Profile Next Temperature",
         value_fn=lambda device: _profile_next_temp(device.data.active_profile, device),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-            and not device.time_clock_mode
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC | Capability.STAT_MODE,
         unit_of_measurement_fn=lambda _, sys_data: (
             HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
         ),
@@ -685,14 +638,114 @@ SENSORS: tuple[HeatmiserNeoSensorEntityDescription, ...] = (
         name="Profile Next Time",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda device: _profile_next_time(device.data.active_profile, device),
-        setup_filter_fn=lambda device, _: (
-            device.device_type in HEATMISER_TYPE_IDS_THERMOSTAT_NOT_HC
-        ),
+        capabilities=Capability.THERMOSTAT_NOT_HC,
         enabled_by_default_fn=profile_sensor_enabled_by_default,
     ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_heating_duty_cycle_1h",
+        name="Heating Duty Cycle 1h",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: _history_value(
+            device, lambda h: h.duty_cycle(DUTY_CYCLE_SHORT_WINDOW)
+        ),
+        capabilities=Capability.CLIMATE,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_heating_duty_cycle_24h",
+        name="Heating Duty Cycle 24h",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: _history_value(
+            device, lambda h: h.duty_cycle(DUTY_CYCLE_LONG_WINDOW)
+        ),
+        capabilities=Capability.CLIMATE,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_temperature_rate_of_change",
+        name="Temperature Rate of Change",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: _history_value(
+            device, lambda h: h.rate_of_change(RATE_OF_CHANGE_WINDOW)
+        ),
+        capabilities=Capability.CLIMATE,
+        unit_of_measurement_fn=lambda _, sys_data: _rate_of_change_unit(sys_data),
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_time_to_setpoint",
+        name="Time to Setpoint",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: _history_value(
+            device, lambda h: h.time_to_setpoint(RATE_OF_CHANGE_WINDOW)
+        ),
+        capabilities=Capability.CLIMATE,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_heating_runtime",
+        name="Heating Runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: device.coordinator.runtime.device_hours(
+            device.data.name, HVACAction.HEATING
+        ),
+        capabilities=Capability.CLIMATE,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_preheating_runtime",
+        name="Preheating Runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: device.coordinator.runtime.device_hours(
+            device.data.name, HVACAction.PREHEATING
+        ),
+        capabilities=Capability.CLIMATE,
+    ),
+    HeatmiserNeoSensorEntityDescription(
+        key="heatmiser_neo_cooling_runtime",
+        name="Cooling Runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: device.coordinator.runtime.device_hours(
+            device.data.name, HVACAction.COOLING
+        ),
+        capabilities=Capability.CAN_COOL | Capability.STAT_MODE,
+    ),
 )
 
+
+def _hub_can_cool(coordinator: HeatmiserNeoCoordinator) -> bool:
+    """Return whether the hub has devices that can cool."""
+    return (
+        coordinator.system_data.GLOBAL_SYSTEM_TYPE != GlobalSystemType.HEAT_ONLY
+        and any(caps & Capability.HC for caps in coordinator.capabilities.values())
+    )
+
+
+def _hub_temperature_unit(sys_data) -> str | None:
+    """Return the temperature unit of the hub."""
+    return HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF, None)
+
+
 HUB_SENSORS: tuple[HeatmiserNeoHubSensorEntityDescription, ...] = (
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_connection",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.ENUM,
+        options=[e.value for e in CircuitState],
+        value_fn=lambda coordinator: coordinator.hub.breaker.state.value,
+        translation_key="hub_connection",
+    ),
     HeatmiserNeoHubSensorEntityDescription(
         key="heatmiser_neohub_zigbee_channel",
         entity_registry_enabled_default=False,
@@ -717,25 +770,14 @@ HUB_SENSORS: tuple[HeatmiserNeoHubSensorEntityDescription, ...] = (
         custom_functions={
             SERVICE_RENAME_PROFILE: async_rename_profile,
             SERVICE_DELETE_PROFILE: async_delete_profile,
+            SERVICE_ASSIGN_PROFILE: async_assign_profile,
             SERVICE_GET_PROFILE_DEFINITIONS: async_get_profile_definitions,
-            SERVICE_CREATE_PROFILE_ONE: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.ONE
-            ),
-            SERVICE_CREATE_PROFILE_TWO: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.TWO
-            ),
-            SERVICE_CREATE_PROFILE_SEVEN: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.SEVEN
-            ),
-            SERVICE_CREATE_TIMER_PROFILE_ONE: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.ONE, True
-            ),
-            SERVICE_CREATE_TIMER_PROFILE_TWO: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.TWO, True
-            ),
-            SERVICE_CREATE_TIMER_PROFILE_SEVEN: lambda e, s: async_create_profile(
-                e, s, ScheduleFormat.SEVEN, True
-            ),
+            **{
+                service: partial(
+                    async_create_profile, requested_format=profile_format, timer=timer
+                )
+                for service, (profile_format, timer) in CREATE_PROFILE_SERVICES.items()
+            },
         },
     ),
     HeatmiserNeoHubSensorEntityDescription(
@@ -748,6 +790,25 @@ HUB_SENSORS: tuple[HeatmiserNeoHubSensorEntityDescription, ...] = (
         else None,
         translation_key="hub_profile_alt_timer_format",
     ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_heating_runtime",
+        name="Heating Runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        value_fn=lambda coordinator: coordinator.runtime.hub_hours(
+            HVACAction.HEATING, HVACAction.PREHEATING
+        ),
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_cooling_runtime",
+        name="Cooling Runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        value_fn=lambda coordinator: coordinator.runtime.hub_hours(HVACAction.COOLING),
+        setup_filter_fn=lambda coordinator: _hub_can_cool(coordinator),
+    ),
     HeatmiserNeoHubSensorEntityDescription(
         key="heatmiser_neohub_heating_levels",
         device_class=SensorDeviceClass.ENUM,
@@ -755,6 +816,58 @@ HUB_SENSORS: tuple[HeatmiserNeoHubSensorEntityDescription, ...] = (
         value_fn=lambda coordinator: coordinator.system_data.HEATING_LEVELS,
         translation_key="hub_profile_heating_levels",
     ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_zones_heating",
+        name="Zones Heating",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.summary.zones_heating,
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_zones_cooling",
+        name="Zones Cooling",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.summary.zones_cooling,
+        setup_filter_fn=lambda coordinator: _hub_can_cool(coordinator),
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_zones_offline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        name="Devices Offline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.summary.zones_offline,
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_low_battery",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        name="Devices With Low Battery",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.summary.low_battery,
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_min_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Minimum Temperature",
+        value_fn=lambda coordinator: coordinator.summary.min_temperature,
+        unit_of_measurement_fn=_hub_temperature_unit,
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_max_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Maximum Temperature",
+        value_fn=lambda coordinator: coordinator.summary.max_temperature,
+        unit_of_measurement_fn=_hub_temperature_unit,
+    ),
+    HeatmiserNeoHubSensorEntityDescription(
+        key="heatmiser_neohub_mean_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        name="Mean Temperature",
+        value_fn=lambda coordinator: coordinator.summary.mean_temperature,
+        unit_of_measurement_fn=_hub_temperature_unit,
+    ),
 )
 
 
@@ -763,7 +876,7 @@ class HeatmiserNeoSensor(HeatmiserNeoEntity, SensorEntity):
 
     def __init__(
         self,
-        neostat: NeoStat,
+        neostat: NeoDevice,
         coordinator: HeatmiserNeoCoordinator,
         hub: NeoHub,
         entity_description: HeatmiserNeoSensorEntityDescription,
@@ -813,6 +926,33 @@ class HeatmiserNeoHubSensor(HeatmiserNeoHubEntity, SensorEntity):
         """Return the sensors temperature value."""
         return self.entity_description.value_fn(self.coordinator)
 
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit of measurement."""
+        if self.entity_description.unit_of_measurement_fn:
+            return self.entity_description.unit_of_measurement_fn(
+                self.coordinator.system_data
+            )
+
+        return self.entity_description.native_unit_of_measurement
+
+
+def _rate_of_change_unit(sys_data) -> str | None:
+    """Return the temperature unit per hour of the hub, if the unit is known."""
+    if unit := HEATMISER_TEMPERATURE_UNIT_HA_UNIT.get(sys_data.CORF):
+        return f"{unit}/h"
+    return None
+
+
+def _history_value(
+    entity: HeatmiserNeoSensor, fn: Callable[[DeviceHistory], Any]
+) -> Any | None:
+    """Compute a value from the recorded history of the entity's device."""
+    history = entity.coordinator.history.get(entity.data.name)
+    if history is None:
+        return None
+    return fn(history)
+
 
 def _profile_current_temp(profile_id, entity: HeatmiserNeoSensor) -> float | None:
     """Convert a profile id to current temperature."""
@@ -833,10 +973,10 @@ def _profile_next_time(profile_id, entity: HeatmiserNeoSensor) -> str | None:
     t, _ = _profile_next_level(profile_id, entity)
     if not t:
         return None
-    device_time = entity.data._data_.TIME
+    device_time = entity.data.device_time
     if len(device_time) == 4:
         device_time = f"0{device_time}"
-    profile_time = datetime.datetime.strptime(t, "%H:%M")
+    profile_time = _parse_profile_time(t)
     tz = entity.coordinator.system_data.TIME_ZONE
     if entity.coordinator.system_data.DST_ON:
         tz = tz + 1
@@ -845,7 +985,7 @@ def _profile_next_time(profile_id, entity: HeatmiserNeoSensor) -> str | None:
         minute=profile_time.minute,
         second=0,
         microsecond=0,
-        tzinfo=datetime.timezone(datetime.timedelta(minutes=tz * 60)),
+        tzinfo=_hub_timezone(tz),
     )
     if t < device_time:
         return profile_datetime + datetime.timedelta(days=1)
@@ -869,12 +1009,31 @@ def _holiday_end(coordinator: HeatmiserNeoCoordinator) -> datetime.datetime | No
         return None
 
     try:
-        parsed_datetime = datetime.datetime.strptime(holiday_end, HOLIDAY_FORMAT)
-        return parsed_datetime.replace(
-            tzinfo=datetime.timezone(
-                datetime.timedelta(minutes=coordinator.system_data.TIME_ZONE * 60)
-            )
-        )
+        return _parse_holiday_end(holiday_end, coordinator.system_data.TIME_ZONE)
     except ValueError:
         _LOGGER.exception("Failed to parse hub holiday end - %s", holiday_end)
         return None
+
+
+# Profile sensors and the holiday end are evaluated on every update, but the
+# values they parse rarely change, so the parsed times and the hub timezone
+# are cached. A new timezone is only built when TIME_ZONE or DST_ON change.
+
+
+@lru_cache(maxsize=8)
+def _hub_timezone(offset: float) -> datetime.timezone:
+    """Return a timezone for a hub UTC offset in hours."""
+    return datetime.timezone(datetime.timedelta(minutes=offset * 60))
+
+
+@lru_cache(maxsize=64)
+def _parse_profile_time(value: str) -> datetime.time:
+    """Parse a profile level time (HH:MM)."""
+    return datetime.datetime.strptime(value, "%H:%M").time()
+
+
+@lru_cache(maxsize=1)
+def _parse_holiday_end(holiday_end: str, offset: float) -> datetime.datetime:
+    """Parse the hub holiday end in the hub timezone."""
+    parsed_datetime = datetime.datetime.strptime(holiday_end, HOLIDAY_FORMAT)
+    return parsed_datetime.replace(tzinfo=_hub_timezone(offset))
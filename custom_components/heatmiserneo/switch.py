@@ -6,7 +6,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 import logging
 
-from neohubapi.neohub import NeoHub, NeoStat
+from neohubapi.neohub import NeoHub
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.core import HomeAssistant
@@ -19,6 +19,7 @@ from .entity import (
     HeatmiserNeoHubEntity,
     HeatmiserNeoHubEntityDescription,
 )
+from .models import NeoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,7 +52,7 @@ class HeatmiserNeoSwitchEntityDescription(
 ):
     """Describes a button entity."""
 
-    value_fn: Callable[[NeoStat], bool]
+    value_fn: Callable[[NeoDevice], bool]
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -95,12 +96,16 @@ class HeatmiserNeoHubSwitch(HeatmiserNeoHubEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
+        if self.coordinator.already_set(self.coordinator.system_data, NTP_ON="Running"):
+            return
         await self._hub.set_ntp(True)
         setattr(self.coordinator.system_data, "NTP_ON", "Running")
         self.coordinator.async_update_listeners()
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
+        if self.coordinator.already_set(self.coordinator.system_data, NTP_ON="Stopped"):
+            return
         await self._hub.set_ntp(False)
         setattr(self.coordinator.system_data, "NTP_ON", "Stopped")
         self.coordinator.async_update_listeners()